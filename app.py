@@ -13,7 +13,8 @@ under the `pages/` directory.
 from __future__ import annotations
 
 import os
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Tuple
 
 import streamlit as st
 
@@ -27,6 +28,104 @@ from core.theme import inject_global_styles
 inject_global_styles()
 
 
+# -------------------------------------------------------------------------------------------------
+# Static home page copy (module constants, built once at import)
+# -------------------------------------------------------------------------------------------------
+
+_INTRO_MD = """
+The Cyber Resilience Toolkit presents a single structural model that brings
+together governance intent, control design, architectural components,
+supply-chain relationships and operational signals. Each module provides a
+different vantage point on this model, so outputs and exports preserve
+consistent, well-formed context.
+"""
+
+_SCOPE_MD = """
+The CRT sets out key elements that shape a cyber-resilience environment:
+
+- Governance intent expressed through policies, standards, expectations and exceptions.
+- Controls, safeguards and rationale captured across CRT catalogues.
+- Architectural patterns spanning systems, identity, data, suppliers and service dependencies.
+- Telemetry, signals and behavioural context showing how environments operate over time.
+- Requirements and obligations that influence design, oversight and review activity.
+
+These components are presented within a uniform structure so they can be
+examined, aligned and referenced across different workflows.
+"""
+
+_CAPS_MD = """
+Using the underlying catalogues and structural relationships, the CRT produces
+structured views and exportable bundles that support work such as:
+
+- Structuring policies, standards, exceptions and governance artefacts anchored to controls, scope and requirements.
+- Assembling third-party questionnaires, audit checklists and review narratives from catalogue mappings.
+- Examining architecture views, identity flows and exposure surfaces across assets, services and suppliers.
+- Compiling vendor exposure context from supply-chain and dependency catalogues.
+- Surfacing telemetry sources and operational signals within a consistent descriptive framework.
+- Packaging governance, architecture and risk bundles for downstream review or AI-assisted interpretation workflows.
+
+Each module expresses the same structural model from a different vantage point,
+so exported artefacts preserve lineage back to the CRT catalogues and maintain
+context across documentation, internal templates, and analytical processes.
+
+CRT is a structural environment for assembling context and artefacts — not an
+assessment or compliance engine.
+"""
+
+_STRUCT_MD = """
+The CRT is organised around three principles:
+
+1. **A shared structural model**
+   Controls, governance elements, architectural components and telemetry are aligned
+   within a consistent descriptive framework.
+
+2. **Perspective without fragmentation**
+   Modules present different views of the same underlying structure—governance,
+   architecture, operations, supply-chain and resilience—without creating divergent
+   interpretations.
+
+3. **Context that can be carried forward**
+   Selected material can be organised into structured bundles for review,
+   collaboration or AI-assisted interpretation. Bundles preserve lineage to the CRT catalogues,
+   providing clarity across downstream work.
+"""
+
+
+@st.cache_data(show_spinner=False)
+def _read_bytes_cached(path: str, mtime: float) -> bytes:
+    """
+    Read a binary asset once per (path, mtime); later reruns are served from cache.
+    """
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _load_file_bytes(path: str) -> bytes:
+    """
+    Return the bytes of `path`, re-reading from disk only when the file changes.
+    """
+    return _read_bytes_cached(path, os.path.getmtime(path))
+
+
+@lru_cache(maxsize=8)
+def _resolve_paths(current_file: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Build the root-relative path table once per `current_file` (stable per process).
+    """
+    paths = get_named_paths(current_file)
+    root_path = paths["level_up_0"]
+
+    return (
+        ("root", root_path),
+        ("brand_logo", os.path.join(root_path, "brand", "blake_logo.png")),
+        # Sidebar image (e.g., grouping / overview visual)
+        ("sidebar_image", os.path.join(root_path, "images", "grouping-image-crt.png")),
+        # Main-page "start here" hero image
+        ("hero_image", os.path.join(root_path, "images", "start-here.png")),
+        ("about_support_md", os.path.join(root_path, "docs", "about_and_support.md")),
+    )
+
+
 def _get_paths(current_file: str) -> Dict[str, str]:
     """
     Resolve key filesystem paths relative to the current file.
@@ -42,18 +141,7 @@ def _get_paths(current_file: str) -> Dict[str, str]:
         A dictionary containing important root-relative paths used for
         loading brand assets and documentation.
     """
-    paths = get_named_paths(current_file)
-    root_path = paths["level_up_0"]
-
-    return {
-        "root": root_path,
-        "brand_logo": os.path.join(root_path, "brand", "blake_logo.png"),
-        # Sidebar image (e.g., grouping / overview visual)
-        "sidebar_image": os.path.join(root_path, "images", "grouping-image-crt.png"),
-        # Main-page "start here" hero image
-        "hero_image": os.path.join(root_path, "images", "start-here.png"),
-        "about_support_md": os.path.join(root_path, "docs", "about_and_support.md"),
-    }
+    return dict(_resolve_paths(current_file))
 
 
 # -------------------------------------------------------------------------------------------------
@@ -176,14 +264,14 @@ def _render_sidebar(paths: Dict[str, str]) -> None:
 
         pdf_path = os.path.join(root_path, "docs", "cyber-resilience-toolkit-index-controls-reference.pdf")
         if os.path.isfile(pdf_path):
-            with open(pdf_path, "rb") as f:
-                st.download_button(
-                    "📚 CRT — Index & Controls Reference",
-                    f.read(),
-                    file_name="cyber-resilience-toolkit-index-controls-reference.pdf",
-                    mime="application/pdf",
-                    use_container_width=True,
-                )
+            # Deferred: bytes are only read when the button is clicked (and cached thereafter)
+            st.download_button(
+                "📚 CRT — Index & Controls Reference",
+                lambda: _load_file_bytes(pdf_path),
+                file_name="cyber-resilience-toolkit-index-controls-reference.pdf",
+                mime="application/pdf",
+                use_container_width=True,
+            )
         else:
             st.info("Reference PDF not found in /docs.")
 # -------------------------------------------------------------------------------------------------
@@ -195,15 +283,7 @@ def _render_intro_block() -> None:
     Render the high-level conceptual introduction to the CRT.
     """
     st.markdown("### Overview")
-    st.write(
-        """
-The Cyber Resilience Toolkit presents a single structural model that brings
-together governance intent, control design, architectural components,
-supply-chain relationships and operational signals. Each module provides a
-different vantage point on this model, so outputs and exports preserve
-consistent, well-formed context.
-        """
-    )
+    st.write(_INTRO_MD)
 
 
 def _render_scope_block() -> None:
@@ -211,20 +291,7 @@ def _render_scope_block() -> None:
     Render the 'What the CRT brings into view' section.
     """
     st.markdown("### What the CRT Brings Into View")
-    st.write(
-        """
-The CRT sets out key elements that shape a cyber-resilience environment:
-
-- Governance intent expressed through policies, standards, expectations and exceptions.
-- Controls, safeguards and rationale captured across CRT catalogues.
-- Architectural patterns spanning systems, identity, data, suppliers and service dependencies.
-- Telemetry, signals and behavioural context showing how environments operate over time.
-- Requirements and obligations that influence design, oversight and review activity.
-
-These components are presented within a uniform structure so they can be
-examined, aligned and referenced across different workflows.
-        """
-    )
+    st.write(_SCOPE_MD)
 
 
 def _render_capabilities_block() -> None:
@@ -233,26 +300,7 @@ def _render_capabilities_block() -> None:
     and artefact-oriented work.
     """
     st.markdown("### What the CRT Sets Out")
-    st.write(
-        """
-Using the underlying catalogues and structural relationships, the CRT produces
-structured views and exportable bundles that support work such as:
-
-- Structuring policies, standards, exceptions and governance artefacts anchored to controls, scope and requirements.
-- Assembling third-party questionnaires, audit checklists and review narratives from catalogue mappings.
-- Examining architecture views, identity flows and exposure surfaces across assets, services and suppliers.
-- Compiling vendor exposure context from supply-chain and dependency catalogues.
-- Surfacing telemetry sources and operational signals within a consistent descriptive framework.
-- Packaging governance, architecture and risk bundles for downstream review or AI-assisted interpretation workflows.
-
-Each module expresses the same structural model from a different vantage point,
-so exported artefacts preserve lineage back to the CRT catalogues and maintain
-context across documentation, internal templates, and analytical processes.
-
-CRT is a structural environment for assembling context and artefacts — not an
-assessment or compliance engine.
-        """
-    )
+    st.write(_CAPS_MD)
 
 
 def _render_structure_block() -> None:
@@ -260,25 +308,7 @@ def _render_structure_block() -> None:
     Render the 'How the environment holds together' section.
     """
     st.markdown("### How the Environment Holds Together")
-    st.write(
-        """
-The CRT is organised around three principles:
-
-1. **A shared structural model**
-   Controls, governance elements, architectural components and telemetry are aligned
-   within a consistent descriptive framework.
-
-2. **Perspective without fragmentation**
-   Modules present different views of the same underlying structure—governance,
-   architecture, operations, supply-chain and resilience—without creating divergent
-   interpretations.
-
-3. **Context that can be carried forward**
-   Selected material can be organised into structured bundles for review,
-   collaboration or AI-assisted interpretation. Bundles preserve lineage to the CRT catalogues,
-   providing clarity across downstream work.
-        """
-    )
+    st.write(_STRUCT_MD)
 
 
 def _render_start_here_block(paths: Dict[str, str]) -> None:
@@ -17,14 +17,43 @@ It simply assembles structured data into the approved AI bundle format.
 """
 
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import Dict, Any, List, TypedDict
 import json
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 # --------------------------------------------------------------
 # Locked bundle schema
 # --------------------------------------------------------------
 
+class BundleEntities(TypedDict):
+    assets: List[Dict[str, Any]]
+    identities: List[Dict[str, Any]]
+    data_domains: List[Dict[str, Any]]
+    vendors: List[Dict[str, Any]]
+    controls: List[Dict[str, Any]]
+    failures: List[Dict[str, Any]]
+    telemetry: List[Dict[str, Any]]
+
+
+class BundleStructuralFindings(TypedDict):
+    gaps: List[Any]
+    compensations: List[Any]
+    coverage: Dict[str, Any]
+    propagation_paths: List[Any]
+
+
+# Core guardrails (always enforced; callers may add further safe flags)
+_DEFAULT_GUARDRAILS: Dict[str, bool] = {
+    "no_advice": True,
+    "no_configuration": True,
+    "no_assurance": True,
+}
+
 def build_ai_bundle(
     *,
     module: str,
@@ -82,32 +111,33 @@ def build_ai_bundle(
         Safety flags for AI interpretation
     """
 
+    # Missing entity types default to [] (not ()) — consumers check isinstance(..., list)
+    bundle_entities = BundleEntities(
+        assets=entities.get("assets", []),
+        identities=entities.get("identities", []),
+        data_domains=entities.get("data_domains", []),
+        vendors=entities.get("vendors", []),
+        controls=entities.get("controls", []),
+        failures=entities.get("failures", []),
+        telemetry=entities.get("telemetry", []),
+    )
+
+    bundle_guardrails = _DEFAULT_GUARDRAILS.copy()
+    bundle_guardrails.update(guardrails)  # allows for future safe flags
+
     return {
         "bundle_type": bundle_type,
         "module": module,
         "primary_entity": primary_entity,
-        "entities": {
-            "assets": entities.get("assets", []),
-            "identities": entities.get("identities", []),
-            "data_domains": entities.get("data_domains", []),
-            "vendors": entities.get("vendors", []),
-            "controls": entities.get("controls", []),
-            "failures": entities.get("failures", []),
-            "telemetry": entities.get("telemetry", []),
-        },
+        "entities": bundle_entities,
         "relationships": relationships,
-        "structural_findings": {
-            "gaps": structural_findings.get("gaps", []),
-            "compensations": structural_findings.get("compensations", []),
-            "coverage": structural_findings.get("coverage", {}),
-            "propagation_paths": structural_findings.get("propagation_paths", []),
-        },
-        "guardrails": {
-            "no_advice": True,
-            "no_configuration": True,
-            "no_assurance": True,
-            **guardrails   # allows for future safe flags
-        }
+        "structural_findings": BundleStructuralFindings(
+            gaps=structural_findings.get("gaps", []),
+            compensations=structural_findings.get("compensations", []),
+            coverage=structural_findings.get("coverage", {}),
+            propagation_paths=structural_findings.get("propagation_paths", []),
+        ),
+        "guardrails": bundle_guardrails,
     }
 
 
@@ -119,8 +149,16 @@ def bundle_to_pretty_json(bundle: Dict[str, Any]) -> str:
     """
     Produce a deterministic, prettified JSON string
     for display in Streamlit or export panels.
+
+    Returns "{}" only if the bundle is not JSON-serialisable
+    (e.g. circular references); other errors propagate.
     """
+    if orjson is not None:
+        try:
+            return orjson.dumps(bundle, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass  # e.g. non-str keys — fall back to stdlib json
     try:
-        return json.dumps(bundle, indent=2, ensure_ascii=False)
-    except Exception:
+        return json.dumps(bundle, indent=2, ensure_ascii=False, separators=(",", ": "))
+    except (TypeError, ValueError):
         return "{}"
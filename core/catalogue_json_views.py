@@ -9,6 +9,9 @@
 # - Drop Excel artefact columns: any column starting with "Unnamed:"
 # - Drop fully empty columns (all values empty/"")
 # - Robust CSV read: utf-8 / utf-8-sig / latin1 + last-resort decode
+# - Payloads are memoised in-process keyed on CSV mtime; the on-disk JSON is a write-through
+# - meta.content_hash lets an unchanged re-save skip the JSON rewrite
+# - pandas is imported lazily (only when a CSV is actually parsed)
 #
 # Output directory:
 #   apps/data_sources/crt_catalogues/json/
@@ -20,13 +23,24 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import json
 import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timezone
-from io import StringIO
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from io import BytesIO, StringIO
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 
 # Canonical catalogue set (explicit, stable)
@@ -42,17 +56,71 @@ ALL_CRT_CATALOGUES: Tuple[str, ...] = (
     *CRT_POLICY_STD,
 )
 
+# Upper bound for the batch projection thread pool
+_MAX_WORKERS = 8
+
 
-def _utc_now_iso() -> str:
+def utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
-def _mtime_utc_iso(path: str) -> str:
+def _mtime_utc_iso_from_ts(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _stat_file(path: str) -> Optional[os.stat_result]:
+    """Single stat() per path; None if missing or not a regular file."""
     try:
-        ts = os.path.getmtime(path)
+        result = os.stat(path)
     except OSError:
-        ts = 0.0
-    return datetime.fromtimestamp(ts, tz=timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+        return None
+    return result if stat.S_ISREG(result.st_mode) else None
+
+
+def _dump_json(payload: Dict[str, Any], path: str) -> None:
+    """Write a JSON view (2-space indent, sorted keys, UTF-8); orjson when available."""
+    if orjson is not None:
+        try:
+            data = orjson.dumps(
+                payload,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            data = None
+        if data is not None:
+            with open(path, "wb") as f:
+                f.write(data)
+            return
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True, ensure_ascii=False)
+
+
+def content_hash(columns: List[str], records: List[Dict[str, Any]]) -> str:
+    """Stable digest of the projected content (excludes generation timestamps)."""
+    content = {"columns": columns, "records": records}
+    if orjson is not None:
+        try:
+            data = orjson.dumps(content, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            data = None
+        if data is not None:
+            return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    data = json.dumps(content, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def read_view_content_hash(json_path: str) -> Optional[str]:
+    """Return meta.content_hash of an existing JSON view, or None."""
+    try:
+        with open(json_path, "rb") as f:
+            raw = f.read()
+        existing = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except Exception:
+        return None
+    meta = existing.get("meta") if isinstance(existing, dict) else None
+    return meta.get("content_hash") if isinstance(meta, dict) else None
 
 
 def _ensure_dir(path: str) -> None:
@@ -71,61 +139,76 @@ def _json_view_path(crt_catalogue_dir: str, catalogue_key: str) -> str:
     return os.path.join(_json_dir(crt_catalogue_dir), f"{catalogue_key}.json")
 
 
-def _is_effectively_empty(v: Any) -> bool:
-    if v is None:
-        return True
-    if isinstance(v, float) and pd.isna(v):
-        return True
-    s = str(v).strip()
-    return s == ""
-
-
 def _drop_excel_artefact_columns(df: pd.DataFrame) -> pd.DataFrame:
-    cols = list(df.columns)
-    drop_cols = [c for c in cols if str(c).strip().startswith("Unnamed:")]
-    if drop_cols:
-        df = df.drop(columns=drop_cols, errors="ignore")
+    mask = df.columns.astype(str).str.strip().str.startswith("Unnamed:")
+    if mask.any():
+        df = df.loc[:, ~mask]
     return df
 
 
 def _drop_fully_empty_columns(df: pd.DataFrame) -> pd.DataFrame:
-    # Treat NaN as empty string first
+    # Treat NaN as empty string first (the returned frame is always NaN-free)
     df2 = df.fillna("")
-    keep_cols: List[str] = []
-    for c in df2.columns:
-        series = df2[c]
-        # keep if any cell is non-empty
-        if any(not _is_effectively_empty(x) for x in series.tolist()):
-            keep_cols.append(c)
-    return df2[keep_cols] if keep_cols else df2
+    # keep a column if any cell is non-empty after stripping (vectorised per column)
+    stripped = df2.astype(str).apply(lambda s: s.str.strip())
+    keep_mask = (stripped != "").any(axis=0)
+    return df2.loc[:, keep_mask.to_numpy()] if keep_mask.any() else df2
+
+
+def _read_csv_engines() -> Tuple[str, ...]:
+    """pandas CSV engines to try, fastest first; pyarrow only when installed."""
+    try:
+        import pyarrow  # noqa: F401  # pylint: disable=unused-import
+    except ImportError:
+        return ("c",)
+    return ("pyarrow", "c")
 
 
 def read_csv_with_fallback_df(path: str) -> pd.DataFrame:
     """
     Read CSV robustly:
     - try utf-8, utf-8-sig, latin1
+    - per encoding: pyarrow engine first (multi-threaded), C engine as fallback
     - final fallback: decode bytes as utf-8 with replacement
     """
+    import pandas as pd  # deferred: only paid when a projection is actually (re)built
+
     if not os.path.isfile(path):
         return pd.DataFrame()
 
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except OSError:
+        return pd.DataFrame()
+
     encodings = ("utf-8", "utf-8-sig", "latin1")
+    engines = _read_csv_engines()
     last_error: Optional[Exception] = None
 
     for enc in encodings:
+        # Validate up front: the pyarrow engine yields undecoded bytes columns instead of raising
         try:
-            return pd.read_csv(path, encoding=enc)
+            raw.decode(enc)
         except UnicodeDecodeError as exc:
             last_error = exc
             continue
-        except Exception as exc:
-            last_error = exc
-            continue
+        for engine in engines:
+            try:
+                df = pd.read_csv(BytesIO(raw), encoding=enc, engine=engine)
+            except Exception as exc:
+                last_error = exc
+                continue
+            # Arrow keeps blank/duplicate header names as-is; the C engine renames them
+            # ("Unnamed: N" / "name.1"), which the Excel-artefact cleanup relies on
+            if engine == "pyarrow" and (
+                not df.columns.is_unique or any(str(c) == "" for c in df.columns)
+            ):
+                continue
+            return df
 
     # Final fallback
     try:
-        with open(path, "rb") as f:
-            raw = f.read()
         text = raw.decode("utf-8", errors="replace")
         return pd.read_csv(StringIO(text))
     except Exception:
@@ -133,82 +216,178 @@ def read_csv_with_fallback_df(path: str) -> pd.DataFrame:
         return pd.DataFrame()
 
 
-def is_json_view_stale(crt_catalogue_dir: str, catalogue_key: str) -> bool:
-    csv_path = _csv_path(crt_catalogue_dir, catalogue_key)
-    json_path = _json_view_path(crt_catalogue_dir, catalogue_key)
-
-    if not os.path.isfile(csv_path):
+def is_json_view_stale(
+    crt_catalogue_dir: str,
+    catalogue_key: str,
+    *,
+    csv_stat: Optional[os.stat_result] = None,
+) -> bool:
+    if csv_stat is None:
+        csv_stat = _stat_file(_csv_path(crt_catalogue_dir, catalogue_key))
+    if csv_stat is None:
         return False
-    if not os.path.isfile(json_path):
-        return True
 
-    try:
-        return os.path.getmtime(json_path) < os.path.getmtime(csv_path)
-    except OSError:
+    json_stat = _stat_file(_json_view_path(crt_catalogue_dir, catalogue_key))
+    if json_stat is None:
         return True
 
+    return json_stat.st_mtime < csv_stat.st_mtime
 
-def ensure_catalogue_json_view(
-    crt_catalogue_dir: str,
+
+def _build_catalogue_payload(
+    csv_path: str,
     catalogue_key: str,
     *,
-    force: bool = False,
-) -> Optional[str]:
+    csv_mtime: float,
+    generated_at_utc: Optional[str] = None,
+) -> Dict[str, Any]:
     """
-    Ensure a single catalogue JSON view exists and is up-to-date.
-    Returns JSON path or None if the CSV does not exist.
+    Project a catalogue CSV into the JSON view payload ({ "meta": ..., "records": ... }).
     """
-    csv_path = _csv_path(crt_catalogue_dir, catalogue_key)
-    if not os.path.isfile(csv_path):
-        return None
-
-    json_path = _json_view_path(crt_catalogue_dir, catalogue_key)
-    if not force and not is_json_view_stale(crt_catalogue_dir, catalogue_key):
-        return json_path
-
-    _ensure_dir(_json_dir(crt_catalogue_dir))
+    generated_at_utc = generated_at_utc or utc_now_iso()
+    source_csv_mtime_utc = _mtime_utc_iso_from_ts(csv_mtime)
 
     df = read_csv_with_fallback_df(csv_path)
     if df.empty:
-        payload: Dict[str, Any] = {
+        return {
             "meta": {
                 "catalogue": catalogue_key,
-                "generated_at_utc": _utc_now_iso(),
+                "generated_at_utc": generated_at_utc,
                 "source_csv": os.path.basename(csv_path),
-                "source_csv_mtime_utc": _mtime_utc_iso(csv_path),
+                "source_csv_mtime_utc": source_csv_mtime_utc,
                 "row_count": 0,
                 "columns": [],
+                "content_hash": content_hash([], []),
                 "notes": "CSV unreadable or empty.",
             },
             "records": [],
         }
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, sort_keys=True, ensure_ascii=False)
-        return json_path
 
     df = _drop_excel_artefact_columns(df)
+    # Also normalises NaN → "" (single fill pass)
     df = _drop_fully_empty_columns(df)
 
-    # Normalise NaN → "" (already done in drop_fully_empty_columns, but keep deterministic)
-    df = df.fillna("")
+    # Column-wise build: one tolist() per column (native Python scalars), then zip rows
+    labels = df.columns.tolist()
+    columns_data = [df.iloc[:, i].tolist() for i in range(len(labels))]
+    records: List[Dict[str, Any]] = [dict(zip(labels, row)) for row in zip(*columns_data)]
+    cols = [str(c) for c in labels]
 
-    records: List[Dict[str, Any]] = df.to_dict(orient="records")  # type: ignore[assignment]
-    cols = [str(c) for c in df.columns.tolist()]
-
-    payload = {
+    return {
         "meta": {
             "catalogue": catalogue_key,
-            "generated_at_utc": _utc_now_iso(),
+            "generated_at_utc": generated_at_utc,
             "source_csv": os.path.basename(csv_path),
-            "source_csv_mtime_utc": _mtime_utc_iso(csv_path),
+            "source_csv_mtime_utc": source_csv_mtime_utc,
             "row_count": len(records),
             "columns": cols,
+            "content_hash": content_hash(cols, records),
         },
         "records": records,
     }
 
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, sort_keys=True, ensure_ascii=False)
+
+def _csv_sig(csv_stat: os.stat_result) -> Tuple[int, int]:
+    return csv_stat.st_mtime_ns, csv_stat.st_size
+
+
+@lru_cache(maxsize=2 * len(ALL_CRT_CATALOGUES))
+def _build_catalogue_payload_cached(
+    crt_catalogue_dir: str,
+    catalogue_key: str,
+    csv_mtime: float,
+    csv_sig: Tuple[int, int],
+) -> Dict[str, Any]:
+    """
+    In-process memo of the CSV → payload projection.
+
+    Keyed by the CSV's (mtime_ns, size) so an edited CSV invalidates automatically.
+    The returned dict is shared between callers and must be treated as read-only.
+    """
+    return _build_catalogue_payload(
+        _csv_path(crt_catalogue_dir, catalogue_key),
+        catalogue_key,
+        csv_mtime=csv_mtime,
+    )
+
+
+def get_catalogue_payload(
+    crt_catalogue_dir: str,
+    catalogue_key: str,
+    *,
+    csv_stat: Optional[os.stat_result] = None,
+) -> Dict[str, Any]:
+    """
+    Return the JSON view payload for a catalogue, served from memory while the CSV is unchanged.
+    Returns {} if the CSV does not exist.
+
+    Each call returns its own deep copy, so callers may mutate it without touching the memo.
+    """
+    return copy.deepcopy(_memoised_payload(crt_catalogue_dir, catalogue_key, csv_stat))
+
+
+def _memoised_payload(
+    crt_catalogue_dir: str,
+    catalogue_key: str,
+    csv_stat: Optional[os.stat_result],
+) -> Dict[str, Any]:
+    """Shared (read-only) memo entry for a catalogue, or {} if the CSV does not exist."""
+    if csv_stat is None:
+        csv_stat = _stat_file(_csv_path(crt_catalogue_dir, catalogue_key))
+    if csv_stat is None:
+        return {}
+    return _build_catalogue_payload_cached(
+        crt_catalogue_dir, catalogue_key, csv_stat.st_mtime, _csv_sig(csv_stat)
+    )
+
+
+def ensure_catalogue_json_view(
+    crt_catalogue_dir: str,
+    catalogue_key: str,
+    *,
+    force: bool = False,
+    csv_stat: Optional[os.stat_result] = None,
+    now_iso: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Ensure a single catalogue JSON view exists and is up-to-date.
+    Returns JSON path or None if the CSV does not exist.
+
+    csv_stat / now_iso may be supplied by batch callers so the CSV is stat'ed once
+    and all views in a batch share one generation timestamp.
+    """
+    csv_path = _csv_path(crt_catalogue_dir, catalogue_key)
+    if csv_stat is None:
+        csv_stat = _stat_file(csv_path)
+    if csv_stat is None:
+        return None
+
+    json_path = _json_view_path(crt_catalogue_dir, catalogue_key)
+    if not force and not is_json_view_stale(crt_catalogue_dir, catalogue_key, csv_stat=csv_stat):
+        return json_path
+
+    _ensure_dir(_json_dir(crt_catalogue_dir))
+
+    if force:
+        payload = _build_catalogue_payload(
+            csv_path,
+            catalogue_key,
+            csv_mtime=csv_stat.st_mtime,
+            generated_at_utc=now_iso,
+        )
+    else:
+        payload = _memoised_payload(crt_catalogue_dir, catalogue_key, csv_stat)
+        # CSV re-saved without content changes: refresh the view's mtime instead of rewriting it
+        if read_view_content_hash(json_path) == payload["meta"]["content_hash"]:
+            try:
+                os.utime(json_path)
+                return json_path
+            except OSError:
+                pass
+        # The memoised payload keeps the time it was first built; stamp this write (batch time if given)
+        payload = {**payload, "meta": {**payload["meta"], "generated_at_utc": now_iso or utc_now_iso()}}
+
+    _dump_json(payload, json_path)
 
     return json_path
 
@@ -224,23 +403,29 @@ def ensure_all_catalogue_json_views(
     Returns mapping: catalogue_key -> json_path (only for those with existing CSVs).
     """
     keys = list(catalogue_keys) if catalogue_keys else list(ALL_CRT_CATALOGUES)
-    out: Dict[str, str] = {}
-    for k in keys:
-        p = ensure_catalogue_json_view(crt_catalogue_dir, k, force=force)
-        if p:
-            out[k] = p
-    return out
+    now_iso = utc_now_iso()
+
+    def _ensure(k: str) -> Tuple[str, Optional[str]]:
+        return k, ensure_catalogue_json_view(crt_catalogue_dir, k, force=force, now_iso=now_iso)
+
+    if len(keys) <= 1:
+        results = [_ensure(k) for k in keys]
+    else:
+        # Catalogues are independent (read + parse + write); file I/O and pandas parsing release the GIL
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(keys))) as ex:
+            results = list(ex.map(_ensure, keys))
+
+    return {k: p for k, p in results if p}
 
 
 def load_catalogue_json_view(crt_catalogue_dir: str, catalogue_key: str) -> Dict[str, Any]:
     """
-    Load JSON view (ensuring it exists first). Returns {} if missing/unreadable.
+    Load JSON view (ensuring it exists on disk first). Returns {} if missing/unreadable.
+
+    The payload is a fresh copy of the in-process memo rather than a re-parse of the file on disk.
     """
-    p = ensure_catalogue_json_view(crt_catalogue_dir, catalogue_key, force=False)
-    if not p or not os.path.isfile(p):
-        return {}
-    try:
-        with open(p, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
+    csv_stat = _stat_file(_csv_path(crt_catalogue_dir, catalogue_key))
+    p = ensure_catalogue_json_view(crt_catalogue_dir, catalogue_key, force=False, csv_stat=csv_stat)
+    if not p:
         return {}
+    return get_catalogue_payload(crt_catalogue_dir, catalogue_key, csv_stat=csv_stat)
@@ -4,7 +4,7 @@ helpers.py
 Minimal helper utilities for the Cyber Resilience Toolkit (CRT).
 
 Only the functions actively used across CRT pages are included here:
-- load_markdown_file: safe markdown loader
+- load_markdown_file: safe markdown loader (memoised per file mtime)
 - get_named_paths: lightweight project path resolver
 
 This file is intentionally cloud-safe and contains no subprocess,
@@ -14,13 +14,25 @@ network, or system-level operations.
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import Dict
 
 
+@lru_cache(maxsize=64)
+def _read_markdown_cached(file_path: str, mtime: float) -> str:
+    """
+    Read a markdown file once per (path, mtime).
+    """
+    with open(file_path, "r", encoding="utf-8") as file:
+        return file.read()
+
+
 def load_markdown_file(file_path: str) -> str | None:
     """
     Load and return the contents of a markdown file.
 
+    Content is cached in-process and re-read only when the file's mtime changes.
+
     Parameters
     ----------
     file_path : str
@@ -32,8 +44,7 @@ def load_markdown_file(file_path: str) -> str | None:
         Markdown file content if readable, otherwise None.
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            return file.read()
+        return _read_markdown_cached(file_path, os.path.getmtime(file_path))
     except (FileNotFoundError, OSError):
         return None
 
@@ -28,17 +28,30 @@ It only helps modules organise structural data and construct bundles.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 
 from core.bundle_builder import build_ai_bundle
 
 
+# Entity groups carried by every state / bundle (fixed by the locked schema)
+_ENTITY_TYPES = (
+    "assets",
+    "identities",
+    "data_domains",
+    "vendors",
+    "controls",
+    "failures",
+    "telemetry",
+)
+_ENTITY_TYPES_SET = frozenset(_ENTITY_TYPES)
+
+
 # -------------------------------------------------------------------
 # Shared state container for CRT modules
 # -------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class CRTModuleState:
     """
     Shared state used by CRT modules to organise structural data
@@ -54,15 +67,7 @@ class CRTModuleState:
     # 2) Entities (catalogue slices) grouped by type
     #    Each list element should be a dict representing a row or record
     entities: Dict[str, List[Dict[str, Any]]] = field(
-        default_factory=lambda: {
-            "assets": [],
-            "identities": [],
-            "data_domains": [],
-            "vendors": [],
-            "controls": [],
-            "failures": [],
-            "telemetry": [],
-        }
+        default_factory=lambda: {entity_type: [] for entity_type in _ENTITY_TYPES}
     )
 
     # 3) Relationships between entities
@@ -78,6 +83,7 @@ class CRTModuleState:
 
     # 4) Structural findings derived by the module
     #    Gaps, compensations, coverage calculations, propagation paths, etc.
+    #    The list keys always exist; the note_*/add_* helpers append to them directly.
     structural_findings: Dict[str, Any] = field(
         default_factory=lambda: {
             "gaps": [],
@@ -123,10 +129,11 @@ def add_entity(
 
     entity : dict
         A dictionary representing a row from a catalogue.
+
+    Any other entity_type raises ValueError: the bundle schema has no slot for it.
     """
-    if entity_type not in state.entities:
-        # Be defensive but keep behaviour predictable
-        state.entities[entity_type] = []
+    if entity_type not in _ENTITY_TYPES_SET:
+        raise ValueError(f"Unknown entity_type: {entity_type!r}")
     state.entities[entity_type].append(entity)
 
 
@@ -172,7 +179,7 @@ def note_gap(
     entry = {"description": description}
     if context:
         entry["context"] = context
-    state.structural_findings.setdefault("gaps", []).append(entry)
+    state.structural_findings["gaps"].append(entry)
 
 
 def note_compensation(
@@ -189,7 +196,7 @@ def note_compensation(
     entry: Dict[str, Any] = {"n_id": n_id}
     if notes:
         entry["notes"] = notes
-    state.structural_findings.setdefault("compensations", []).append(entry)
+    state.structural_findings["compensations"].append(entry)
 
 
 def set_coverage(
@@ -219,7 +226,7 @@ def add_propagation_path(
 
     path should be a list of steps, each a small dict with IDs/types.
     """
-    state.structural_findings.setdefault("propagation_paths", []).append(path)
+    state.structural_findings["propagation_paths"].append(path)
 
 
 # -------------------------------------------------------------------
@@ -277,3 +284,31 @@ def build_bundle_for_module(
     )
 
     return bundle
+
+
+def make_bundle_builder(
+    module_name: str,
+    bundle_type: str,
+    extra_guardrails: Optional[Dict[str, bool]] = None,
+) -> Callable[[CRTModuleState], Dict[str, Any]]:
+    """
+    Specialise build_bundle_for_module for a fixed (module, bundle_type, guardrails).
+
+    Intended to be called once at page import; the returned callable takes only
+    the populated CRTModuleState and produces the same bundle as
+    build_bundle_for_module would with those arguments.
+    """
+    guardrails = dict(extra_guardrails or {})
+
+    def _build(state: CRTModuleState) -> Dict[str, Any]:
+        return build_ai_bundle(
+            module=module_name,
+            bundle_type=bundle_type,
+            primary_entity=state.primary_entity,
+            entities=state.entities,
+            relationships=state.relationships,
+            structural_findings=state.structural_findings,
+            guardrails=guardrails,
+        )
+
+    return _build
@@ -23,7 +23,6 @@ from typing import Any, Dict, Optional
 
 from core.catalogue_json_views import (
     ALL_CRT_CATALOGUES,
-    ensure_all_catalogue_json_views,
     load_catalogue_json_view,
 )
 
@@ -48,13 +47,11 @@ def build_full_context_ai_payload(
     - This does not edit any catalogues.
     """
 
-    # Ensure JSON projections exist (regen if stale)
-    ensure_all_catalogue_json_views(crt_catalogue_dir, force=False, catalogue_keys=ALL_CRT_CATALOGUES)
-
-    # Load full catalogue universe
-    universe: Dict[str, Any] = {}
-    for k in ALL_CRT_CATALOGUES:
-        universe[k] = load_catalogue_json_view(crt_catalogue_dir, k)
+    # Full catalogue universe as a plain dict (the payload is serialised for AI export);
+    # each JSON projection is ensured (regen if stale) and served from the mtime memo
+    universe: Dict[str, Any] = {
+        k: load_catalogue_json_view(crt_catalogue_dir, k) for k in ALL_CRT_CATALOGUES
+    }
 
     org_profile = programme_bundle.get("org_profile") if isinstance(programme_bundle.get("org_profile"), dict) else {}
     org_scope = programme_bundle.get("org_governance_scope") if isinstance(programme_bundle.get("org_governance_scope"), dict) else {}
@@ -18,9 +18,18 @@ The SIH never:
 
 from __future__ import annotations
 import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from typing import Dict, Any, List, Optional
 
+try:
+    import pyarrow  # noqa: F401  # pylint: disable=unused-import
+    _CSV_READERS = ("pyarrow", "c")
+except ImportError:  # pragma: no cover
+    _CSV_READERS = ("c",)
+
 
 BACKBONE_CATALOGUES = [
     "CRT-C",   # Controls
@@ -41,17 +50,66 @@ APPEND_ONLY_CATALOGUES = [
     "CRT-G",   # Control Groups / Domains
 ]
 
+# Identifier columns probed by resolve_entity, in priority order
+ID_COLUMN_CANDIDATES = (
+    "control_id", "failure_id", "n_id", "policy_id",
+    "standard_id", "lr_id",
+    "requirement_id", "requirement_set_id",
+    "d_id", "as_id",
+    "i_id", "sc_id", "telemetry_id",
+    "group_id",
+)
+
+# Catalogues inverted for build_relationships, keyed by the column that names each row
+_RELATIONSHIP_ID_COLUMNS = {
+    "CRT-F": "failure_id",
+    "CRT-N": "n_id",
+}
+
+# Top-level keys every outbound bundle must carry (locked schema)
+_REQUIRED_BUNDLE_KEYS = frozenset({
+    "bundle_type", "module", "primary_entity",
+    "entities", "relationships", "structural_findings",
+    "guardrails"
+})
+
+# pandas' default NA markers: the C reader would turn these cells into NaN (then ""),
+# so they are blanked explicitly when NA detection is off
+_CSV_NA_TOKENS = [
+    "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+]
+
+# Separators used in mapped_*_ids cells ("A;B", "A, B", one per line)
+_ID_LIST_SPLIT = re.compile(r"[;,\n]")
+
 class SystemIntegratorHub:
     """
     The SIH is instantiated once at app load and shared across modules.
+    Catalogues are loaded lazily, the first time a module asks for them.
     """
 
     def __init__(self, base_path: str):
         self.base_path = base_path
         self.catalogues: Dict[str, pd.DataFrame] = {}
-
-        # Load catalogues at startup
-        self._load_all_catalogues()
+        self._empty_df = pd.DataFrame()
+        # Per catalogue: rows as dicts (built once at load; shared with the ID indices)
+        self._records: Dict[str, List[Dict[str, Any]]] = {}
+        # Per catalogue: its primary ID column (first present in ID_COLUMN_CANDIDATES), if any
+        self._id_col: Dict[str, Optional[str]] = {}
+        # Per catalogue: one merged {id -> row} index over all present ID columns
+        # (earlier columns take precedence, then first row wins)
+        self._id_index: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # CRT-F / CRT-N: control_id -> [row ids] inverted from mapped_control_ids (see _RELATIONSHIP_ID_COLUMNS)
+        self._control_mappings: Dict[str, Dict[str, List[str]]] = {}
+
+        # Known catalogue -> CSV filename; each is loaded on first access (see _ensure_loaded)
+        self._loaders: Dict[str, str] = {
+            name: f"{name}.csv" for name in BACKBONE_CATALOGUES + APPEND_ONLY_CATALOGUES
+        }
+        # Serialises first-access loads (the hub is shared across sessions; see get_sih)
+        self._load_lock = threading.Lock()
 
     # --------------------------------------------------------------
     # Catalogue loading
@@ -62,78 +120,133 @@ class SystemIntegratorHub:
         if not os.path.exists(path):
             return pd.DataFrame()
 
-        try:
-            df = pd.read_csv(path, dtype=str).fillna("")
-            return df
-        except Exception:
-            return pd.DataFrame()
+        # All-string read with NA detection off: empty cells arrive as "" (no fillna pass);
+        # the default NA markers are then blanked in one pass, as the NaN -> "" fill did.
+        # Arrow's multi-threaded parser first; the C engine also covers rows Arrow rejects.
+        for engine in _CSV_READERS:
+            try:
+                if engine == "pyarrow":
+                    df = pd.read_csv(path, dtype=str, keep_default_na=False, engine="pyarrow")
+                    # Blank/duplicate header names: let the C engine apply its "Unnamed: N" / "name.1" renaming
+                    if not df.columns.is_unique or any(str(c) == "" for c in df.columns):
+                        continue
+                else:
+                    df = pd.read_csv(path, dtype=str, keep_default_na=False, na_filter=False)
+                return df.replace(_CSV_NA_TOKENS, "")
+            except Exception:
+                continue
+        return pd.DataFrame()
 
     def _load_all_catalogues(self):
         """
-        Loads all CRT CSVs into memory.
+        Loads all (not yet loaded) CRT CSVs into memory.
+
+        Not called at startup — catalogues load on demand — but available to
+        callers that know they will need the full set.
 
         Backbones are treated as authoritative.
         Append-only catalogues may have user extensions applied at the CSV level,
         but SIH does not merge or rewrite them.
         """
-        self.catalogues["CRT-C"] = self._load_catalogue("CRT-C.csv")
-        self.catalogues["CRT-F"] = self._load_catalogue("CRT-F.csv")
-        self.catalogues["CRT-N"] = self._load_catalogue("CRT-N.csv")
-        self.catalogues["CRT-POL"] = self._load_catalogue("CRT-POL.csv")
-        self.catalogues["CRT-STD"] = self._load_catalogue("CRT-STD.csv")
+        names = [n for n in self._loaders if n not in self.catalogues]
+        if not names:
+            return
 
-        self.catalogues["CRT-LR"]  = self._load_catalogue("CRT-LR.csv")
-        self.catalogues["CRT-REQ"] = self._load_catalogue("CRT-REQ.csv")
-        self.catalogues["CRT-D"]   = self._load_catalogue("CRT-D.csv")
-        self.catalogues["CRT-AS"]  = self._load_catalogue("CRT-AS.csv")
-        self.catalogues["CRT-I"]   = self._load_catalogue("CRT-I.csv")
-        self.catalogues["CRT-SC"]  = self._load_catalogue("CRT-SC.csv")
-        self.catalogues["CRT-T"]   = self._load_catalogue("CRT-T.csv")
-        self.catalogues["CRT-G"]   = self._load_catalogue("CRT-G.csv")
+        # CSV parsing releases the GIL, so loads overlap; registration stays in list order
+        with ThreadPoolExecutor(max_workers=min(8, len(names))) as ex:
+            frames = list(ex.map(lambda n: self._load_catalogue(self._loaders[n]), names))
+
+        with self._load_lock:
+            for name, df in zip(names, frames):
+                if name not in self.catalogues:
+                    self._register_catalogue(name, df)
+
+    def _ensure_loaded(self, name: str) -> None:
+        """
+        Load a known catalogue on first access; unknown names are left unloaded.
+        The hub is shared across sessions, so the check and the registration run under one lock.
+        """
+        if name in self.catalogues or name not in self._loaders:
+            return
+        with self._load_lock:
+            if name not in self.catalogues:
+                self._register_catalogue(name, self._load_catalogue(self._loaders[name]))
+
+    def _register_catalogue(self, name: str, df: pd.DataFrame) -> None:
+        """
+        Store a loaded catalogue, its records, and its ID indices (first row wins per ID).
+
+        Everything is built first and the frame is published last: a catalogue
+        present in self.catalogues always has its records and indices in place.
+        """
+        records: List[Dict[str, Any]] = df.to_dict(orient="records") if not df.empty else []
 
+        id_cols = [c for c in ID_COLUMN_CANDIDATES if c in df.columns]
+        id_col = id_cols[0] if id_cols else None
+
+        index: Dict[str, Dict[str, Any]] = {}
+        for key in id_cols:
+            for row in records:
+                index.setdefault(row[key], row)
+
+        self._records[name] = records
+        self._id_col[name] = id_col
+        self._id_index[name] = index
+        self._control_mappings[name] = self._invert_mapped_control_ids(df, _RELATIONSHIP_ID_COLUMNS.get(name))
+        self.catalogues[name] = df
+
+    @staticmethod
+    def _invert_mapped_control_ids(df: pd.DataFrame, key_col: Optional[str]) -> Dict[str, List[str]]:
+        """
+        Tokenise mapped_control_ids once and invert it: control_id -> [key_col values of rows mapping it].
+        A control matches whole tokens only ("C-1" does not match a row mapping "C-10").
+        """
+        if df.empty or key_col is None or "mapped_control_ids" not in df.columns:
+            return {}
+
+        row_ids = df[key_col].tolist() if key_col in df.columns else [""] * len(df)
+        mapping: Dict[str, List[str]] = {}
+        for row_id, mapped in zip(row_ids, df["mapped_control_ids"].tolist()):
+            if not mapped:
+                continue
+            tokens = (t.strip() for t in _ID_LIST_SPLIT.split(mapped))
+            for cid in dict.fromkeys(t for t in tokens if t):
+                mapping.setdefault(cid, []).append(row_id)
+        return mapping
 
     # --------------------------------------------------------------
     # Public API
     # --------------------------------------------------------------
-    def get_catalogue(self, name: str) -> pd.DataFrame:
+    def get_catalogue(self, name: str, copy: bool = False) -> pd.DataFrame:
         """
         Return the requested catalogue as a DataFrame.
         Always returns a valid DataFrame (possibly empty).
+
+        The shared, loaded frame is returned and must be treated as read-only;
+        pass copy=True to obtain a private copy that may be mutated.
         """
-        return self.catalogues.get(name, pd.DataFrame()).copy()
+        self._ensure_loaded(name)
+        df = self.catalogues.get(name, self._empty_df)
+        return df.copy() if copy else df
 
     def get_all_entities(self, catalogue: str) -> List[Dict[str, Any]]:
         """
         Return the entire catalogue as dicts.
+
+        The list is materialised once at load and shared; treat it as read-only.
         """
-        df = self.get_catalogue(catalogue)
-        return df.to_dict(orient="records")
+        self._ensure_loaded(catalogue)
+        return self._records.get(catalogue, [])
 
     def resolve_entity(self, catalogue: str, entity_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a single entity by ID.
         """
-        df = self.get_catalogue(catalogue)
-        if df.empty:
+        self._ensure_loaded(catalogue)
+        if self._id_col.get(catalogue) is None:
             return None
-
-        key_col_candidates = [
-            "control_id", "failure_id", "n_id", "policy_id",
-            "standard_id", "lr_id",
-            "requirement_id", "requirement_set_id",
-            "d_id", "as_id",
-            "i_id", "sc_id", "telemetry_id",
-            "group_id",
-        ]
-
-
-        for key in key_col_candidates:
-            if key in df.columns:
-                row = df[df[key] == entity_id]
-                if not row.empty:
-                    return row.to_dict(orient="records")[0]
-
-        return None
+        row = self._id_index[catalogue].get(entity_id)
+        return dict(row) if row is not None else None
 
     def build_relationships(self, primary: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -148,30 +261,26 @@ class SystemIntegratorHub:
         # Example: if entity is a control, map failures and compensations
         if "control_id" in primary:
             cid = primary["control_id"]
-
-            failures = self.get_catalogue("CRT-F")
-            if not failures.empty and "mapped_control_ids" in failures.columns:
-                for _, row in failures.iterrows():
-                    if cid in (row.get("mapped_control_ids") or ""):
-                        rels.append({
-                            "from_type": "control",
-                            "from_id": cid,
-                            "rel": "failure_implication",
-                            "to_type": "failure",
-                            "to_id": row.get("failure_id", "")
-                        })
-
-            comp = self.get_catalogue("CRT-N")
-            if not comp.empty and "mapped_control_ids" in comp.columns:
-                for _, row in comp.iterrows():
-                    if cid in (row.get("mapped_control_ids") or ""):
-                        rels.append({
-                            "from_type": "control",
-                            "from_id": cid,
-                            "rel": "compensated_by",
-                            "to_type": "compensation",
-                            "to_id": row.get("n_id", "")
-                        })
+            self._ensure_loaded("CRT-F")
+            self._ensure_loaded("CRT-N")
+
+            for fid in self._control_mappings.get("CRT-F", {}).get(cid, []):
+                rels.append({
+                    "from_type": "control",
+                    "from_id": cid,
+                    "rel": "failure_implication",
+                    "to_type": "failure",
+                    "to_id": fid
+                })
+
+            for nid in self._control_mappings.get("CRT-N", {}).get(cid, []):
+                rels.append({
+                    "from_type": "control",
+                    "from_id": cid,
+                    "rel": "compensated_by",
+                    "to_type": "compensation",
+                    "to_id": nid
+                })
 
         # Additional relationship logic for assets/data/identity/vendors/telemetry
         # can be added here as the catalogues mature.
@@ -186,25 +295,28 @@ class SystemIntegratorHub:
         Ensures the outbound bundle matches the locked schema.
         Used before export or AI handoff.
         """
-        required_keys = {
-            "bundle_type", "module", "primary_entity",
-            "entities", "relationships", "structural_findings",
-            "guardrails"
-        }
-
-        return required_keys.issubset(bundle.keys())
+        return _REQUIRED_BUNDLE_KEYS <= bundle.keys()
 
 
 # --------------------------------------------------------------
 # Singleton accessor
 # --------------------------------------------------------------
 _sih_instance: Optional[SystemIntegratorHub] = None
+_sih_lock = threading.Lock()
 
 def get_sih(base_path: str) -> SystemIntegratorHub:
     """
     Accessor for a process-wide SIH instance.
+
+    Double-checked: the lock is only taken until the instance exists, so
+    concurrent first calls (Streamlit script threads) still build exactly one.
     """
     global _sih_instance
-    if _sih_instance is None:
-        _sih_instance = SystemIntegratorHub(base_path)
-    return _sih_instance
+    inst = _sih_instance
+    if inst is None:
+        with _sih_lock:
+            inst = _sih_instance
+            if inst is None:
+                inst = SystemIntegratorHub(base_path)
+                _sih_instance = inst
+    return inst
@@ -55,11 +55,15 @@ import re
 import os
 import sys
 import json
+import codecs
 import shutil
+import stat
 import glob
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from io import StringIO
-from typing import List, Optional, Tuple, Dict, Any
+from functools import lru_cache
+from io import BytesIO, StringIO
+from typing import Callable, List, Optional, Set, Tuple, Dict, Any
 
 # -------------------------------------------------------------------------------------------------
 # Path Setup
@@ -73,6 +77,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "c
 # Third-party Libraries
 # -------------------------------------------------------------------------------------------------
 import streamlit as st
+import numpy as np
 import pandas as pd
 
 # -------------------------------------------------------------------------------------------------
@@ -83,6 +88,11 @@ from core.helpers import (  # pylint: disable=import-error
     load_markdown_file,
     build_sidebar_links,
 )
+from core.catalogue_json_views import (  # pylint: disable=import-error
+    content_hash,
+    read_view_content_hash,
+    utc_now_iso,
+)
 
 # -------------------------------------------------------------------------------------------------
 # Resolve Key Paths (for modules under /pages)
@@ -251,6 +261,16 @@ CATALOGUES_CONFIG: Dict[str, Dict[str, Optional[str]]] = {
     },
 }
 
+# ACTIVE working / SHIPPED DEFAULT CSV path per catalogue (resolved once at import)
+_ACTIVE_PATHS: Dict[str, str] = {
+    k: os.path.join(CRT_CATALOGUE_DIR, v.get("filename") or f"{k}.csv")
+    for k, v in CATALOGUES_CONFIG.items()
+}
+_DEFAULT_PATHS: Dict[str, str] = {
+    k: os.path.join(PROJECT_PATH, "apps", "data_sources", "defaults", v.get("filename") or f"{k}.csv")
+    for k, v in CATALOGUES_CONFIG.items()
+}
+
 # Locked backbone: CRT-G/C/F/N cannot be edited via UI
 LOCKED_CATALOGUES: List[str] = ["CRT-G", "CRT-C", "CRT-F", "CRT-N"]
 
@@ -262,6 +282,17 @@ GOVERNANCE_CATALOGUES: List[str] = ["CRT-UC", "CRT-POL", "CRT-LR", "CRT-STD"]
 # CSV Reading Helpers (UTF-8 + Fallback)
 # -------------------------------------------------------------------------------------------------
 
+# Arrow's multi-threaded CSV reader when available; the C engine also covers files Arrow rejects
+try:
+    import pyarrow  # noqa: F401  # pylint: disable=unused-import
+    _CSV_ENGINES: Tuple[str, ...] = ("pyarrow", "c")
+except ImportError:  # pragma: no cover
+    _CSV_ENGINES = ("c",)
+
+# Arrow-backed strings hold text columns in contiguous buffers (vs one PyObject per cell);
+# without pyarrow, text columns stay as plain object columns.
+_TEXT_DTYPE: Optional[str] = "string[pyarrow]" if "pyarrow" in _CSV_ENGINES else None
+
 # -------------------------------------------------------------------------------------------------
 # Small path helper
 # -------------------------------------------------------------------------------------------------
@@ -271,41 +302,106 @@ def _ensure_dir(path: str) -> None:
         return
     os.makedirs(path, exist_ok=True)
 
-def read_csv_with_fallback(path: str) -> pd.DataFrame:
+def _file_sig(path: str) -> Optional[Tuple[float, int]]:
+    """(mtime, size) for a regular file, or None if it is missing. Used as a cache key."""
+    try:
+        st_res = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st_res.st_mode):
+        return None
+    return st_res.st_mtime, st_res.st_size
+
+
+def _arrow_header_differs(df: pd.DataFrame) -> bool:
     """
-    Safely read a CSV file, trying UTF-8 / UTF-8-SIG first, then Latin-1 as a fallback.
+    True if Arrow kept blank or duplicate header names, which the C engine would rename
+    ("Unnamed: N" / "name.1"); such files are re-read with the C engine for identical columns.
+    """
+    return not df.columns.is_unique or any(str(c) == "" for c in df.columns)
 
-    This avoids UnicodeDecodeError when catalogues include extended characters or
-    have been saved with a non-UTF-8 codepage via Excel or similar tools.
+
+def _sniff_csv_encoding(raw: bytes) -> str:
     """
-    if not os.path.isfile(path):
-        return pd.DataFrame()
+    Pick the encoding once, up front: valid UTF-8 -> UTF-8 (UTF-8-SIG with a BOM),
+    else Latin-1 (which decodes any byte sequence, e.g. Excel codepage exports).
+    """
+    try:
+        raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return "latin1"
+    return "utf-8-sig" if raw.startswith(b"\xef\xbb\xbf") else "utf-8"
+
+
+def _to_text_dtype(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store all-text object columns as _TEXT_DTYPE; missing cells (NaN, or Arrow's None) become <NA>.
+    Numeric and mixed columns are left as parsed.
+    """
+    if _TEXT_DTYPE is None:
+        return df
+    text_cols = [
+        col for col in df.columns[df.dtypes == object]
+        if pd.api.types.infer_dtype(df[col], skipna=True) in ("string", "empty")
+    ]
+    if text_cols:
+        df[text_cols] = df[text_cols].astype(_TEXT_DTYPE)
+    return df
+
+
+def _is_text_col(series: pd.Series) -> bool:
+    """
+    True for text columns, whether held as object or as a pandas string dtype.
+    """
+    return series.dtype == object or isinstance(series.dtype, pd.StringDtype)
 
-    encodings = ("utf-8", "utf-8-sig", "latin1")
-    last_error: Optional[Exception] = None
 
-    for enc in encodings:
+@st.cache_data(show_spinner=False)
+def _cached_read_csv(path: str, mtime: float, size: int) -> pd.DataFrame:
+    """
+    Parse `path` once per (mtime, size); unchanged files are served from memory on reruns.
+    """
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except OSError:
+        return pd.DataFrame()
+
+    enc = _sniff_csv_encoding(raw)
+    for engine in _CSV_ENGINES:
         try:
-            return pd.read_csv(path, encoding=enc)
-        except UnicodeDecodeError as exc:  # pragma: no cover - defensive
-            last_error = exc
+            df = pd.read_csv(BytesIO(raw), encoding=enc, engine=engine)
+        except Exception:  # pragma: no cover - defensive
             continue
-        except Exception as exc:  # pragma: no cover - defensive
-            last_error = exc
+        if engine == "pyarrow" and _arrow_header_differs(df):
             continue
+        return _to_text_dtype(df)
 
     # Final, very defensive fallback: decode bytes as UTF-8 with replacement
     # so we never completely fail on encoding issues.
     try:
-        with open(path, "rb") as f:
-            raw = f.read()
         text = raw.decode("utf-8", errors="replace")
-        return pd.read_csv(StringIO(text))
+        return _to_text_dtype(pd.read_csv(StringIO(text)))
     except Exception:
         # If even this fails, return empty but avoid crashing the app.
         return pd.DataFrame()
 
 
+def read_csv_with_fallback(path: str) -> pd.DataFrame:
+    """
+    Safely read a CSV file, trying UTF-8 / UTF-8-SIG first, then Latin-1 as a fallback.
+
+    This avoids UnicodeDecodeError when catalogues include extended characters or
+    have been saved with a non-UTF-8 codepage via Excel or similar tools.
+
+    Results are cached per (path, mtime, size), so reruns do not re-parse unchanged files.
+    """
+    sig = _file_sig(path)
+    if sig is None:
+        return pd.DataFrame()
+    return _cached_read_csv(path, *sig)
+
+
 # -------------------------------------------------------------------------------------------------
 # Data Loading Utilities (Platinum Simple Active + Defaults)
 # -------------------------------------------------------------------------------------------------
@@ -321,24 +417,16 @@ def load_catalogue(name: str) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]
     - Shipped default is always: apps/data_sources/defaults/{filename}
     - Effective = active if present else default
     - No *.user.csv layer exists.
+
+    Each CSV parse is cached on its file's (mtime, size); see read_csv_with_fallback.
     """
     if name not in CATALOGUES_CONFIG:
         return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
 
-    cfg = CATALOGUES_CONFIG[name]
-    filename = cfg.get("filename") or f"{name}.csv"
-
-    active_path = os.path.join(CRT_CATALOGUE_DIR, filename)
-    default_path = os.path.join(PROJECT_PATH, "apps", "data_sources", "defaults", filename)
-
-    df_default = pd.DataFrame()
-    df_active = pd.DataFrame()
+    active_path, default_path = _ACTIVE_PATHS[name], _DEFAULT_PATHS[name]
 
-    if os.path.isfile(default_path):
-        df_default = read_csv_with_fallback(default_path).fillna("")
-
-    if os.path.isfile(active_path):
-        df_active = read_csv_with_fallback(active_path).fillna("")
+    df_default = read_csv_with_fallback(default_path).fillna("")
+    df_active = read_csv_with_fallback(active_path).fillna("")
 
     # Effective preference: active > default
     if not df_active.empty:
@@ -346,7 +434,7 @@ def load_catalogue(name: str) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]
     else:
         df_effective = df_default.copy()
 
-    return df_effective.fillna(""), df_default.fillna(""), df_active.fillna("")
+    return df_effective, df_default, df_active
 
 
 def load_all_catalogues() -> Tuple[Dict[str, pd.DataFrame], Dict[str, Dict[str, pd.DataFrame]]]:
@@ -360,8 +448,12 @@ def load_all_catalogues() -> Tuple[Dict[str, pd.DataFrame], Dict[str, Dict[str,
     catalogues_effective: Dict[str, pd.DataFrame] = {}
     catalogues_raw: Dict[str, Dict[str, pd.DataFrame]] = {}
 
-    for name in CATALOGUES_CONFIG:
-        df_effective, df_default, df_active = load_catalogue(name)
+    # Cold-cache reads/parses overlap across threads; results are collected in config order
+    names = list(CATALOGUES_CONFIG)
+    with ThreadPoolExecutor(max_workers=min(8, len(names))) as ex:
+        loaded = list(ex.map(load_catalogue, names))
+
+    for name, (df_effective, df_default, df_active) in zip(names, loaded):
         catalogues_effective[name] = df_effective
         catalogues_raw[name] = {"default": df_default, "active": df_active}
 
@@ -372,6 +464,10 @@ def load_all_catalogues() -> Tuple[Dict[str, pd.DataFrame], Dict[str, Dict[str,
 # -------------------------------------------------------------------------------------------------
 # Utility Functions for ID Handling
 # -------------------------------------------------------------------------------------------------
+
+# Separators accepted in mapped ID cells
+_ID_SPLIT_RE = re.compile(r"[;,\n]")
+
 def parse_id_list(value: str) -> List[str]:
     """
     Parse a delimited ID string into a list of IDs.
@@ -382,9 +478,16 @@ def parse_id_list(value: str) -> List[str]:
     if not isinstance(value, str) or not value.strip():
         return []
 
+    # Fresh list per call: callers may extend/mutate it, the cached tuple stays intact.
+    return list(_parse_id_list_cached(value))
+
+
+@lru_cache(maxsize=4096)
+def _parse_id_list_cached(value: str) -> Tuple[str, ...]:
+    """Split once per distinct cell value (mapped ID strings repeat heavily across rows)."""
     # Split on semicolons, commas, or newlines, then strip whitespace.
-    parts = re.split(r"[;,\n]", value)
-    return [p.strip() for p in parts if p.strip()]
+    parts = _ID_SPLIT_RE.split(value)
+    return tuple(p.strip() for p in parts if p.strip())
 
 
 def explode_mapped_ids(
@@ -402,15 +505,14 @@ def explode_mapped_ids(
     if df.empty or source_col not in df.columns:
         return pd.DataFrame()
 
-    df_exploded = df.copy()
-    # Use the same parser everywhere so commas/semicolons/newlines all work.
-    df_exploded[target_col] = df_exploded[source_col].fillna("").apply(
-        lambda v: parse_id_list(str(v))
-    )
-    df_exploded = df_exploded.explode(target_col)
-    df_exploded = df_exploded[df_exploded[target_col].astype(str).str.strip() != ""]
-    df_exploded[target_col] = df_exploded[target_col].astype(str).str.strip()
-    return df_exploded
+    # Same separators as parse_id_list (commas/semicolons/newlines), split in pandas' string path.
+    # Blank cells split to [""] and are dropped with the other empty tokens.
+    df_exploded = df.assign(
+        **{target_col: df[source_col].fillna("").astype(str).str.split(_ID_SPLIT_RE)}
+    ).explode(target_col)
+    ids = df_exploded[target_col].str.strip()
+    df_exploded[target_col] = ids
+    return df_exploded[ids != ""]
 
 def get_catalogue_paths(name: str) -> Tuple[str, str]:
     """
@@ -419,30 +521,24 @@ def get_catalogue_paths(name: str) -> Tuple[str, str]:
     Returns:
         (active_path, default_path)
     """
-    cfg = CATALOGUES_CONFIG[name]
-    filename = cfg.get("filename") or f"{name}.csv"
+    return _ACTIVE_PATHS[name], _DEFAULT_PATHS[name]
 
-    active_path = os.path.join(CRT_CATALOGUE_DIR, filename)
-    default_path = os.path.join(PROJECT_PATH, "apps", "data_sources", "defaults", filename)
-    return active_path, default_path
-
-
-def load_catalogue_active_or_default(catalogue_key: str) -> Tuple[pd.DataFrame, str, str]:
-    """
-    Load a catalogue using the ACTIVE file when it exists, otherwise fall back
-    to the SHIPPED DEFAULT.
-
-    Returns:
-      (df, active_path, default_path)
-    """
-    active_path, default_path = get_catalogue_paths(catalogue_key)
 
-    if os.path.exists(active_path):
-        df = read_csv_with_fallback(active_path)
-    else:
-        df = read_csv_with_fallback(default_path)
-
-    return df, active_path, default_path
+def _is_utf8_upload(uploaded_file) -> bool:
+    """True if the whole upload decodes as UTF-8 (checked in 1 MiB chunks, incremental decoder)."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    uploaded_file.seek(0)
+    try:
+        while True:
+            chunk = uploaded_file.read(1 << 20)
+            if not chunk:
+                decoder.decode(b"", final=True)
+                return True
+            if isinstance(chunk, str):  # text-mode file objects are already decoded
+                return False
+            decoder.decode(chunk)
+    except UnicodeDecodeError:
+        return False
 
 
 def overwrite_catalogue_with_backup(catalogue_key: str, uploaded_file) -> str:
@@ -455,6 +551,8 @@ def overwrite_catalogue_with_backup(catalogue_key: str, uploaded_file) -> str:
         CRT_CATALOGUE_DIR/backup/{CATALOGUE}.{YYYYMMDD_HHMMSS}.csv
     - Overwrites ACTIVE file:
         CRT_CATALOGUE_DIR/{CATALOGUE}.csv
+      Uploads that are already clean UTF-8 with stripped headers are copied byte-for-byte;
+      anything else is normalised via pandas (header strip + UTF-8 re-encode).
     - Returns the active_path written
     """
     if catalogue_key not in CATALOGUES_CONFIG:
@@ -465,15 +563,29 @@ def overwrite_catalogue_with_backup(catalogue_key: str, uploaded_file) -> str:
     backup_dir = os.path.join(CRT_CATALOGUE_DIR, "backup")
     _ensure_dir(backup_dir)
 
-    # Read upload
-    try:
-        uploaded_df = pd.read_csv(uploaded_file)
-    except Exception as exc:
-        raise ValueError(f"Could not parse uploaded CSV — {exc}") from exc
+    # Read upload (UTF-8 only: Arrow would return undecoded bytes columns for anything else,
+    # so non-UTF-8 uploads go straight to the C engine, which rejects them)
+    is_utf8 = _is_utf8_upload(uploaded_file)
+    engines = _CSV_ENGINES if is_utf8 else ("c",)
+    uploaded_df: Optional[pd.DataFrame] = None
+    for engine in engines:
+        try:
+            uploaded_file.seek(0)
+            uploaded_df = pd.read_csv(uploaded_file, engine=engine)
+            if engine == "pyarrow" and _arrow_header_differs(uploaded_df):
+                continue
+            break
+        except Exception as exc:
+            if engine == engines[-1]:
+                raise ValueError(f"Could not parse uploaded CSV — {exc}") from exc
 
-    uploaded_df.columns = [str(c).strip() for c in uploaded_df.columns]
+    # The parse above validates the upload; a clean upload needs no re-serialisation
+    stripped_cols = [str(c).strip() for c in uploaded_df.columns]
+    copy_verbatim = is_utf8 and stripped_cols == [str(c) for c in uploaded_df.columns]
+    uploaded_df.columns = stripped_cols
 
     # Backup current active (if present)
+    prior_sig = _file_sig(active_path)
     if os.path.exists(active_path):
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_name = f"{catalogue_key}.{ts}.csv"
@@ -485,32 +597,21 @@ def overwrite_catalogue_with_backup(catalogue_key: str, uploaded_file) -> str:
 
     # Overwrite active
     try:
-        uploaded_df.to_csv(active_path, index=False, encoding="utf-8")
+        if copy_verbatim:
+            uploaded_file.seek(0)
+            with open(active_path, "wb") as f:
+                shutil.copyfileobj(uploaded_file, f, length=1 << 20)
+        else:
+            uploaded_df.to_csv(active_path, index=False, encoding="utf-8")
     except Exception as exc:
         raise ValueError(f"Could not write active catalogue CSV — {exc}") from exc
 
-    return active_path
-
-
-
-def load_catalogue_with_user_override(catalogue_key: str) -> Tuple[pd.DataFrame, str, str]:
-    """Load a catalogue, preferring the active working file, falling back to shipped default.
-
-    Returns:
-      (effective_df, active_csv_path, default_csv_path)
+    # Drop the cached parse of the replaced file (new content is keyed by its new mtime/size)
+    if prior_sig is not None:
+        _cached_read_csv.clear(active_path, *prior_sig)
 
-    Notes:
-    - CRT edits overwrite the active working file (e.g. CRT-LR.csv).
-    - Shipped defaults in /defaults are restore references only.
-    """
-    active_csv_path, default_csv_path = get_catalogue_paths(catalogue_key)
-
-    if os.path.exists(active_csv_path):
-        df = read_csv_with_fallback(active_csv_path)
-    else:
-        df = read_csv_with_fallback(default_csv_path)
+    return active_path
 
-    return df, active_csv_path, default_csv_path
 
 
 def get_latest_backup_path(catalogue_key: str) -> Optional[str]:
@@ -521,10 +622,16 @@ def get_latest_backup_path(catalogue_key: str) -> Optional[str]:
     return matches[-1] if matches else None
 
 
-def write_catalogue_json_view(catalogue_key: str, df_effective: pd.DataFrame) -> str:
+def write_catalogue_json_view(
+    catalogue_key: str,
+    df_effective: pd.DataFrame,
+    generated_utc: Optional[str] = None,
+) -> str:
     """Persist a normalised JSON view of the effective catalogue.
 
     This is a reference model used across CRT for read-only inspection and bundle assembly.
+    `generated_utc` lets batch callers stamp every view with one shared timestamp.
+    A view whose meta.content_hash already matches is left as is (only its mtime is refreshed).
     """
     _ensure_dir(CRT_CATALOGUES_JSON_DIR)
 
@@ -532,10 +639,18 @@ def write_catalogue_json_view(catalogue_key: str, df_effective: pd.DataFrame) ->
 
     # Convert dataframe to list-of-records, ensuring NaNs become empty strings
     records = df_effective.fillna("").to_dict(orient="records")
+    view_hash = content_hash([str(c) for c in df_effective.columns], records)
+    if read_view_content_hash(out_path) == view_hash:
+        try:
+            os.utime(out_path)
+            return out_path
+        except OSError:
+            pass
 
     payload = {
         "catalogue": catalogue_key,
-        "generated_utc": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "generated_utc": generated_utc or utc_now_iso(),
+        "meta": {"content_hash": view_hash},
         "rows": records,
     }
 
@@ -546,11 +661,55 @@ def write_catalogue_json_view(catalogue_key: str, df_effective: pd.DataFrame) ->
 
 def rebuild_all_catalogue_json_views() -> Dict[str, str]:
     """Regenerate JSON views for all configured catalogues (including locked backbone)."""
-    results: Dict[str, str] = {}
-    for n in sorted(CATALOGUES_CONFIG.keys()):
-        eff_df, _, _ = load_catalogue_with_user_override(n)
-        results[n] = write_catalogue_json_view(n, eff_df)
-    return results
+    generated_utc = utc_now_iso()  # one timestamp for the whole batch
+    keys = sorted(CATALOGUES_CONFIG.keys())
+
+    def _rebuild_one(n: str) -> Tuple[str, str]:
+        eff_df, _, _ = load_catalogue(n)
+        return n, write_catalogue_json_view(n, eff_df, generated_utc=generated_utc)
+
+    # Catalogues are independent (read + write one file each); I/O overlaps across threads
+    with ThreadPoolExecutor(max_workers=min(8, len(keys))) as ex:
+        return dict(ex.map(_rebuild_one, keys))
+
+
+def _gather_mapped_ids(df: pd.DataFrame, cols: Tuple[str, ...]) -> pd.Series:
+    """
+    All IDs listed in `cols` (delimited cells, same separators as parse_id_list), as one
+    stripped, non-empty string Series: stacked, split and exploded in pandas' string path.
+    """
+    if not cols or df.empty:
+        return pd.Series([], dtype=object)
+    cells = pd.concat([df[col] for col in cols], ignore_index=True).fillna("").astype(str)
+    ids = cells.str.split(_ID_SPLIT_RE).explode().str.strip()
+    return ids[ids != ""]
+
+
+@lru_cache(maxsize=32)
+def _mapping_cols(cols: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    (mapped_fail*, mapped_comp*) columns of a CRT-C header; cached per header.
+    """
+    return (
+        tuple(col for col in cols if col.lower().startswith("mapped_fail")),
+        tuple(col for col in cols if col.lower().startswith("mapped_comp")),
+    )
+
+
+def _row_mapped_ids(control_row: pd.Series) -> Tuple[Set[str], Set[str]]:
+    """
+    (failure IDs, compensating IDs) listed in one CRT-C row's mapped_fail* / mapped_comp* columns.
+    Sets are enough: callers only test emptiness and filter with .isin. The cached
+    tuples are read directly (no defensive list copy, as nothing here mutates them).
+    """
+    failure_cols, comp_cols = _mapping_cols(tuple(control_row.index))
+    failure_ids: Set[str] = set()
+    for col in failure_cols:
+        failure_ids.update(_parse_id_list_cached(str(control_row.get(col, ""))))
+    comp_ids: Set[str] = set()
+    for col in comp_cols:
+        comp_ids.update(_parse_id_list_cached(str(control_row.get(col, ""))))
+    return failure_ids, comp_ids
 
 
 def build_controls_failure_comp_views(
@@ -575,31 +734,22 @@ def build_controls_failure_comp_views(
     if not control_ids or c_df.empty or "control_id" not in c_df.columns:
         return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
 
-    controls_view = c_df[c_df["control_id"].isin(control_ids)].copy()
+    controls_view = c_df[c_df["control_id"].isin(control_ids)]
     if controls_view.empty:
         return controls_view, pd.DataFrame(), pd.DataFrame()
 
     # Find all relevant mapping columns on CRT-C
-    failure_cols = [col for col in controls_view.columns if col.lower().startswith("mapped_fail")]
-    comp_cols = [col for col in controls_view.columns if col.lower().startswith("mapped_comp")]
-
-    all_failure_ids: List[str] = []
-    all_comp_ids: List[str] = []
+    failure_cols, comp_cols = _mapping_cols(tuple(controls_view.columns))
 
-    for _, row in controls_view.iterrows():
-        for col in failure_cols:
-            all_failure_ids.extend(parse_id_list(str(row.get(col, ""))))
-        for col in comp_cols:
-            all_comp_ids.extend(parse_id_list(str(row.get(col, ""))))
-
-    all_failure_ids = sorted(set(all_failure_ids))
-    all_comp_ids = sorted(set(all_comp_ids))
+    # Unique IDs via pandas' hashtable (order is irrelevant to the .isin lookups below)
+    all_failure_ids = pd.unique(_gather_mapped_ids(controls_view, failure_cols))
+    all_comp_ids = pd.unique(_gather_mapped_ids(controls_view, comp_cols))
 
     failures_view = pd.DataFrame()
     comps_view = pd.DataFrame()
 
     # ----- CRT-F (failures) -----
-    if not f_df.empty and all_failure_ids:
+    if not f_df.empty and len(all_failure_ids):
         failure_id_col = None
         if "failure_id" in f_df.columns:
             failure_id_col = "failure_id"
@@ -607,13 +757,13 @@ def build_controls_failure_comp_views(
             failure_id_col = "failure_mode_id"
 
         if failure_id_col:
-            failures_view = f_df[f_df[failure_id_col].isin(all_failure_ids)].copy()
+            failures_view = f_df[f_df[failure_id_col].isin(all_failure_ids)]
             # Normalise to 'failure_id' so downstream code is consistent
             if failure_id_col != "failure_id":
                 failures_view = failures_view.rename(columns={failure_id_col: "failure_id"})
 
     # ----- CRT-N (compensating controls) -----
-    if not n_df.empty and all_comp_ids:
+    if not n_df.empty and len(all_comp_ids):
         comp_id_col = None
         if "n_id" in n_df.columns:
             comp_id_col = "n_id"
@@ -623,7 +773,7 @@ def build_controls_failure_comp_views(
             comp_id_col = "compensating_control_id"
 
         if comp_id_col:
-            comps_view = n_df[n_df[comp_id_col].isin(all_comp_ids)].copy()
+            comps_view = n_df[n_df[comp_id_col].isin(all_comp_ids)]
             # Normalise to 'n_id'
             if comp_id_col != "n_id":
                 comps_view = comps_view.rename(columns={comp_id_col: "n_id"})
@@ -634,6 +784,33 @@ def build_controls_failure_comp_views(
 # -------------------------------------------------------------------------------------------------
 # Generic Renderers
 # -------------------------------------------------------------------------------------------------
+@st.cache_data(show_spinner=False)
+def _csv_bytes(df: pd.DataFrame) -> bytes:
+    """
+    UTF-8 CSV export of a (filtered) view; cached by frame content, so repeat downloads
+    of an unchanged filter state skip the serialisation pass.
+    """
+    return df.to_csv(index=False).encode("utf-8")
+
+
+def _contains_ci(series: pd.Series, text: str) -> pd.Series:
+    """
+    Literal, case-insensitive "cell contains `text`" as a bool Series (missing -> False).
+    """
+    return series.astype(str).str.contains(text, case=False, regex=False, na=False)
+
+
+def _text_filter_mask(df: pd.DataFrame, text_filter: str, cols: List[str]) -> Optional[pd.Series]:
+    """
+    Row mask for "any of `cols` contains `text_filter`" (case-insensitive, literal), or None if no cols.
+    """
+    mask: Optional[pd.Series] = None
+    for col in cols:
+        series = _contains_ci(df[col], text_filter)
+        mask = series if mask is None else (mask | series)
+    return mask
+
+
 def render_generic_catalogue(name: str, df: pd.DataFrame) -> None:
     """
     Generic browser for CRT-AS, CRT-D, CRT-I, CRT-SC, CRT-T.
@@ -664,25 +841,22 @@ def render_generic_catalogue(name: str, df: pd.DataFrame) -> None:
             key=f"{name.lower()}_text_filter",
         )
 
-    df_view = df.copy()
+    df_view = df  # filters/merge below return new frames; nothing mutates df_view in place
 
     if id_filter and id_col in df_view.columns:
-        df_view = df_view[df_view[id_col].astype(str).str.contains(id_filter, case=False)]
+        df_view = df_view[_contains_ci(df_view[id_col], id_filter)]
 
     if text_filter:
-        mask = False
-        for col in df_view.columns:
-            if df_view[col].dtype == object:
-                series = df_view[col].astype(str).str.contains(text_filter, case=False)
-                mask = series if isinstance(mask, bool) else (mask | series)
-        if not isinstance(mask, bool):
+        text_cols = [col for col in df_view.columns if _is_text_col(df_view[col])]
+        mask = _text_filter_mask(df_view, text_filter, text_cols)
+        if mask is not None:
             df_view = df_view[mask]
 
     if not df_view.empty:
-        csv_bytes = df_view.to_csv(index=False).encode("utf-8")
+        # Deferred: the CSV is only built when the button is clicked
         st.download_button(
             f"⬇️ Download {name} (CSV)",
-            data=csv_bytes,
+            data=lambda df=df_view: _csv_bytes(df),
             file_name=f"{name.lower()}_filtered.csv",
             mime="text/csv",
         )
@@ -715,23 +889,20 @@ def render_crt_g(df: pd.DataFrame) -> None:
             key="crt_g_text_filter",
         )
 
-    df_view = df.copy()
+    df_view = df
     if group_id_filter and "group_id" in df_view.columns:
-        df_view = df_view[df_view["group_id"].astype(str).str.contains(group_id_filter, case=False)]
+        df_view = df_view[_contains_ci(df_view["group_id"], group_id_filter)]
     if text_filter:
-        mask = False
-        for col in ["group_domain", "description"]:
-            if col in df_view.columns:
-                series = df_view[col].astype(str).str.contains(text_filter, case=False)
-                mask = series if isinstance(mask, bool) else (mask | series)
-        if not isinstance(mask, bool):
+        text_cols = [col for col in ["group_domain", "description"] if col in df_view.columns]
+        mask = _text_filter_mask(df_view, text_filter, text_cols)
+        if mask is not None:
             df_view = df_view[mask]
 
     if not df_view.empty:
-        csv_bytes = df_view.to_csv(index=False).encode("utf-8")
+        # Deferred: the CSV is only built when the button is clicked
         st.download_button(
             "⬇️ Download CRT-G Domains (CSV)",
-            data=csv_bytes,
+            data=lambda df=df_view: _csv_bytes(df),
             file_name="crt_g_domains.csv",
             mime="text/csv",
         )
@@ -739,6 +910,23 @@ def render_crt_g(df: pd.DataFrame) -> None:
     st.dataframe(df_view, width="stretch")
 
 
+def _join_group_domain(df_view: pd.DataFrame, df_g: pd.DataFrame) -> pd.DataFrame:
+    """
+    Left-join CRT-G.group_domain onto controls by group_id (suffix "_group" on a name clash).
+
+    With unique group IDs (the normal case) this is a single Series.map lookup; duplicate
+    group IDs keep the merge, whose row fan-out a lookup cannot reproduce.
+    """
+    groups = df_g[["group_id", "group_domain"]]
+    out_col = "group_domain_group" if "group_domain" in df_view.columns else "group_domain"
+    if not groups["group_id"].is_unique or out_col in df_view.columns:
+        return df_view.merge(groups, on="group_id", how="left", suffixes=("", "_group"))
+
+    domains = groups.set_index("group_id")["group_domain"]
+    joined = df_view.assign(**{out_col: df_view["group_id"].map(domains)})
+    return joined.reset_index(drop=True)
+
+
 def render_crt_c(df: pd.DataFrame, df_g: pd.DataFrame) -> None:
     """Render CRT-C controls with group context."""
     st.subheader("CRT-C — Control Reference Catalogue")
@@ -766,39 +954,30 @@ def render_crt_c(df: pd.DataFrame, df_g: pd.DataFrame) -> None:
             key="crt_c_text_filter",
         )
 
-    df_view = df.copy()
+    df_view = df
     if control_id_filter and "control_id" in df_view.columns:
-        df_view = df_view[
-            df_view["control_id"].astype(str).str.contains(control_id_filter, case=False)
-        ]
+        df_view = df_view[_contains_ci(df_view["control_id"], control_id_filter)]
     if group_id_filter and "group_id" in df_view.columns:
-        df_view = df_view[
-            df_view["group_id"].astype(str).str.contains(group_id_filter, case=False)
-        ]
+        df_view = df_view[_contains_ci(df_view["group_id"], group_id_filter)]
     if text_filter:
-        mask = False
         # Be tolerant: scan across text-like columns
-        for col in df_view.columns:
-            if df_view[col].dtype == object and col not in ["control_id", "group_id"]:
-                series = df_view[col].astype(str).str.contains(text_filter, case=False)
-                mask = series if isinstance(mask, bool) else (mask | series)
-        if not isinstance(mask, bool):
+        text_cols = [
+            col for col in df_view.columns
+            if _is_text_col(df_view[col]) and col not in ["control_id", "group_id"]
+        ]
+        mask = _text_filter_mask(df_view, text_filter, text_cols)
+        if mask is not None:
             df_view = df_view[mask]
 
     # Optional: join group domains
     if not df_g.empty and "group_id" in df_view.columns and "group_id" in df_g.columns:
-        df_view = df_view.merge(
-            df_g[["group_id", "group_domain"]],
-            on="group_id",
-            how="left",
-            suffixes=("", "_group"),
-        )
+        df_view = _join_group_domain(df_view, df_g)
 
     if not df_view.empty:
-        csv_bytes = df_view.to_csv(index=False).encode("utf-8")
+        # Deferred: the CSV is only built when the button is clicked
         st.download_button(
             "⬇️ Download CRT-C Controls (CSV)",
-            data=csv_bytes,
+            data=lambda df=df_view: _csv_bytes(df),
             file_name="crt_c_controls.csv",
             mime="text/csv",
         )
@@ -828,28 +1007,24 @@ def render_crt_f(df: pd.DataFrame) -> None:
             key="crt_f_text_filter",
         )
 
-    df_view = df.copy()
+    df_view = df
     if failure_id_filter and "failure_id" in df_view.columns:
-        df_view = df_view[
-            df_view["failure_id"].astype(str).str.contains(failure_id_filter, case=False)
-        ]
+        df_view = df_view[_contains_ci(df_view["failure_id"], failure_id_filter)]
     if text_filter:
-        mask = False
         # Be tolerant: scan all text-like columns except the ID
-        for col in df_view.columns:
-            if col == "failure_id":
-                continue
-            if df_view[col].dtype == object:
-                series = df_view[col].astype(str).str.contains(text_filter, case=False)
-                mask = series if isinstance(mask, bool) else (mask | series)
-        if not isinstance(mask, bool):
+        text_cols = [
+            col for col in df_view.columns
+            if col != "failure_id" and _is_text_col(df_view[col])
+        ]
+        mask = _text_filter_mask(df_view, text_filter, text_cols)
+        if mask is not None:
             df_view = df_view[mask]
 
     if not df_view.empty:
-        csv_bytes = df_view.to_csv(index=False).encode("utf-8")
+        # Deferred: the CSV is only built when the button is clicked
         st.download_button(
             "⬇️ Download CRT-F Failure Modes (CSV)",
-            data=csv_bytes,
+            data=lambda df=df_view: _csv_bytes(df),
             file_name="crt_f_failures.csv",
             mime="text/csv",
         )
@@ -879,28 +1054,24 @@ def render_crt_n(df: pd.DataFrame) -> None:
             key="crt_n_text_filter",
         )
 
-    df_view = df.copy()
+    df_view = df
     if comp_id_filter and "n_id" in df_view.columns:
-        df_view = df_view[
-            df_view["n_id"].astype(str).str.contains(comp_id_filter, case=False)
-        ]
+        df_view = df_view[_contains_ci(df_view["n_id"], comp_id_filter)]
     if text_filter:
-        mask = False
         # Tolerant text search: all string columns except the ID
-        for col in df_view.columns:
-            if col == "n_id":
-                continue
-            if df_view[col].dtype == object:
-                series = df_view[col].astype(str).str.contains(text_filter, case=False)
-                mask = series if isinstance(mask, bool) else (mask | series)
-        if not isinstance(mask, bool):
+        text_cols = [
+            col for col in df_view.columns
+            if col != "n_id" and _is_text_col(df_view[col])
+        ]
+        mask = _text_filter_mask(df_view, text_filter, text_cols)
+        if mask is not None:
             df_view = df_view[mask]
 
     if not df_view.empty:
-        csv_bytes = df_view.to_csv(index=False).encode("utf-8")
+        # Deferred: the CSV is only built when the button is clicked
         st.download_button(
             "⬇️ Download CRT-N Compensating Controls (CSV)",
-            data=csv_bytes,
+            data=lambda df=df_view: _csv_bytes(df),
             file_name="crt_n_compensations.csv",
             mime="text/csv",
         )
@@ -911,6 +1082,217 @@ def render_crt_n(df: pd.DataFrame) -> None:
 # -------------------------------------------------------------------------------------------------
 # Governance Mapping Lenses
 # -------------------------------------------------------------------------------------------------
+# Display projections shared by the governance lenses (shown in this order when present)
+_CTRL_DISPLAY_COLS: Tuple[str, ...] = (
+    "control_id", "control_name", "group_domain", "sub_domain", "type", "function", "risk_level",
+)
+_FAIL_DISPLAY_COLS: Tuple[str, ...] = ("failure_id", "failure_name", "failure_category", "failure_description")
+_COMP_DISPLAY_COLS: Tuple[str, ...] = ("n_id", "compensating_name", "strength", "csf_category")
+_LR_DISPLAY_COLS: Tuple[str, ...] = (
+    "lr_id", "obligation_name", "obligation_description",
+    "severity", "evidence_required", "source_reference_examples",
+)
+_POL_DISPLAY_COLS: Tuple[str, ...] = ("policy_id", "policy_name", "description")
+_STD_DISPLAY_COLS: Tuple[str, ...] = ("standard_id", "standard_name", "description")
+
+
+def _present_cols(df: pd.DataFrame, cols: Tuple[str, ...]) -> List[str]:
+    """
+    The entries of `cols` that `df` has, in the order given.
+    """
+    return [col for col in cols if col in df.columns]
+
+
+def _str_mask(series: pd.Series) -> pd.Series:
+    """
+    True where the cell holds a str (a string-dtype column holds str in every non-missing cell).
+    """
+    if isinstance(series.dtype, pd.StringDtype):
+        return series.notna()
+    return series.map(lambda v: isinstance(v, str)).astype(bool)
+
+
+def _first_match_row(df: pd.DataFrame, col: str, value: Any) -> pd.Series:
+    """
+    First row of `df` whose `col` equals `value`, read by position (no filtered frame is built).
+    Raises IndexError when nothing matches, as `df[df[col] == value].iloc[0]` would.
+    """
+    hits = np.flatnonzero((df[col] == value).to_numpy(dtype=bool, na_value=False))
+    return df.iloc[hits[0]]
+
+
+def _id_labels(
+    df: pd.DataFrame,
+    id_col: str,
+    name_col: str,
+    str_ids_only: bool = True,
+) -> Dict[str, str]:
+    """
+    {id: "id — name"} for a selectbox format_func, built column-wise (no iterrows).
+
+    Rows whose id is not a str are skipped unless `str_ids_only` is False; a missing
+    name column gives "id — ". Later duplicate IDs overwrite earlier ones, as in a dict literal.
+    """
+    if df.empty or id_col not in df.columns:
+        return {}
+    ids = df[id_col]
+    names = df[name_col].astype(str) if name_col in df.columns else ""
+    labels = ids.astype(str) + " — " + names
+    if str_ids_only:
+        keep = _str_mask(ids)
+        ids, labels = ids[keep], labels[keep]
+    return dict(zip(ids.tolist(), labels.tolist()))
+
+
+def _requirement_labels(req_df: pd.DataFrame) -> Dict[str, str]:
+    """
+    {requirement_id: "id — name (ref, set_id)"} for CRT-REQ rows with a str requirement_id;
+    empty parts are omitted. Built column-wise (no iterrows).
+    """
+    if req_df.empty or "requirement_id" not in req_df.columns:
+        return {}
+
+    def _part(col: str) -> Tuple[pd.Series, pd.Series]:
+        # (text, present): present follows the truthiness of the cell, as `value or ""` would
+        if col not in req_df.columns:
+            blank = pd.Series("", index=req_df.index, dtype=object)
+            return blank, pd.Series(False, index=req_df.index)
+        values = req_df[col]
+        return values.astype(str), values.astype(bool)
+
+    ids = req_df["requirement_id"]
+    name, has_name = _part("requirement_name")
+    ref, has_ref = _part("requirement_ref")
+    set_id, has_set = _part("requirement_set_id")
+
+    sep = pd.Series(", ", index=req_df.index).where(has_ref & has_set, "")
+    inner = ref.where(has_ref, "") + sep + set_id.where(has_set, "")
+    labels = (
+        ids.astype(str)
+        + (" — " + name).where(has_name, "")
+        + (" (" + inner + ")").where(has_ref | has_set, "")
+    )
+    keep = _str_mask(ids)
+    return dict(zip(ids[keep].tolist(), labels[keep].tolist()))
+
+
+# Bundle views kept per lens by _session_memo (the views depend only on the set of control IDs)
+_BUNDLE_VIEWS_MEMO = 16
+
+
+def _catalogue_version(*names: str) -> Tuple[Any, ...]:
+    """
+    (active, default) file signatures of the named catalogues: a change means
+    load_catalogue() would now return different frames (uploads and resets rewrite the active CSV).
+    """
+    return tuple(
+        (_file_sig(_ACTIVE_PATHS[name]), _file_sig(_DEFAULT_PATHS[name])) if name in _ACTIVE_PATHS else None
+        for name in names
+    )
+
+
+def _session_memo(
+    slot: str,
+    key: Tuple[Any, ...],
+    build: Callable[[], Any],
+    max_entries: int = 1,
+) -> Any:
+    """
+    build(), reused from st.session_state[slot] while `key` is among its `max_entries`
+    most recently used keys (a small LRU dict per slot, so session memory stays bounded).
+    Stored values are shared across reruns and must be treated as read-only.
+    """
+    memo = st.session_state.get(slot)
+    if not isinstance(memo, dict):
+        memo = st.session_state[slot] = {}
+    if key in memo:
+        memo[key] = memo.pop(key)  # most recently used last
+        return memo[key]
+    value = memo[key] = build()
+    while len(memo) > max_entries:
+        del memo[next(iter(memo))]
+    return value
+
+
+def _explode_by_control(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, np.ndarray]]:
+    """
+    `df` exploded by mapped_control_ids, plus {control_id -> row positions} from one groupby.
+    """
+    exploded = explode_mapped_ids(df, "mapped_control_ids", "_control_id")
+    if exploded.empty or "_control_id" not in exploded.columns:
+        return exploded, {}
+    return exploded, exploded.groupby("_control_id", sort=False).indices
+
+
+def _catalogue_by_control(
+    df: pd.DataFrame,
+    name: str,
+) -> Tuple[pd.DataFrame, Dict[str, np.ndarray]]:
+    """
+    _explode_by_control() for loaded catalogue `name`, kept in the session until its CSV changes.
+    """
+    return _session_memo(
+        f"_{name}_by_control",
+        _catalogue_version(name),
+        lambda: _explode_by_control(df),
+    )
+
+
+def _positions_for_controls(positions: Dict[str, np.ndarray], control_ids: List[str]) -> np.ndarray:
+    """
+    Sorted row positions mapped to any of `control_ids` (the rows .isin would select, in order).
+    """
+    hits = [positions[cid] for cid in dict.fromkeys(control_ids) if cid in positions]
+    if not hits:
+        return np.empty(0, dtype=np.intp)
+    if len(hits) == 1:
+        return hits[0]
+    return np.sort(np.concatenate(hits))
+
+
+def _rows_for_controls(
+    exploded: pd.DataFrame,
+    positions: Dict[str, np.ndarray],
+    control_ids: List[str],
+) -> pd.DataFrame:
+    """
+    Rows of `exploded` mapped to any of `control_ids`, in their original order (as .isin would select).
+    """
+    rows = _positions_for_controls(positions, control_ids)
+    if not len(rows):
+        return exploded.iloc[0:0]
+    return exploded.iloc[rows]
+
+
+def _render_linked_rows(
+    exploded: pd.DataFrame,
+    positions: Dict[str, np.ndarray],
+    control_ids: List[str],
+    id_col: str,
+    display_cols: Tuple[str, ...],
+    empty_msg: str,
+) -> None:
+    """
+    Show the rows of a by-control catalogue (see _catalogue_by_control) linked to `control_ids`:
+    one row per `id_col` (whole-row dedupe if the column is absent), projected to `display_cols`.
+    """
+    rows = _positions_for_controls(positions, control_ids)
+    if not len(rows):
+        st.info(empty_msg)
+        return
+
+    if id_col in exploded.columns:
+        # First row per ID, as drop_duplicates(subset=[id_col]) keeps: factorize codes follow
+        # first appearance, so the first index of each code is already in row order
+        codes, _ = exploded[id_col].iloc[rows].factorize(use_na_sentinel=False)
+        linked = exploded.iloc[rows[np.unique(codes, return_index=True)[1]]]
+    else:
+        linked = exploded.iloc[rows].drop_duplicates()
+
+    cols = _present_cols(linked, display_cols)
+    st.dataframe(linked[cols] if cols else linked, width="stretch")
+
+
 def render_user_control_lens(
     uc_df: pd.DataFrame,
     c_df: pd.DataFrame,
@@ -929,11 +1311,7 @@ def render_user_control_lens(
 
     # Select user control
     uc_options = uc_df["user_control_id"].tolist()
-    uc_labels = {
-        row["user_control_id"]: f"{row['user_control_id']} — {row.get('user_control_name', '')}"
-        for _, row in uc_df.iterrows()
-        if "user_control_id" in row
-    }
+    uc_labels = _id_labels(uc_df, "user_control_id", "user_control_name", str_ids_only=False)
 
     selected_uc_id = st.selectbox(
         "Select a user control",
@@ -941,7 +1319,7 @@ def render_user_control_lens(
         format_func=lambda x: uc_labels.get(x, x),
     )
 
-    sel_row = uc_df[uc_df["user_control_id"] == selected_uc_id].iloc[0]
+    sel_row = _first_match_row(uc_df, "user_control_id", selected_uc_id)
 
     st.markdown("#### Selected User Control")
     meta_cols = st.columns(2)
@@ -962,7 +1340,7 @@ def render_user_control_lens(
     if not mapped_controls or c_df.empty or "control_id" not in c_df.columns:
         st.info("No CRT controls mapped to this user control yet.")
     else:
-        df_controls = c_df[c_df["control_id"].isin(mapped_controls)].copy()
+        df_controls = c_df[c_df["control_id"].isin(mapped_controls)]
         if df_controls.empty:
             st.info("Mapped CRT controls not found in CRT-C catalogue.")
         else:
@@ -974,7 +1352,7 @@ def render_user_control_lens(
     if pol_uc_exploded.empty or "_user_control_id" not in pol_uc_exploded.columns:
         st.info("No policies reference this user control yet.")
     else:
-        df_pols = pol_uc_exploded[pol_uc_exploded["_user_control_id"] == selected_uc_id].copy()
+        df_pols = pol_uc_exploded[pol_uc_exploded["_user_control_id"] == selected_uc_id]
         df_pols = df_pols.drop(columns=["_user_control_id"], errors="ignore")
         if df_pols.empty:
             st.info("No policies linked to this user control.")
@@ -987,7 +1365,7 @@ def render_user_control_lens(
     if lr_uc_exploded.empty or "_user_control_id" not in lr_uc_exploded.columns:
         st.info("No obligations reference this user control yet.")
     else:
-        df_lr = lr_uc_exploded[lr_uc_exploded["_user_control_id"] == selected_uc_id].copy()
+        df_lr = lr_uc_exploded[lr_uc_exploded["_user_control_id"] == selected_uc_id]
         df_lr = df_lr.drop(columns=["_user_control_id"], errors="ignore")
         if df_lr.empty:
             st.info("No obligations linked to this user control.")
@@ -1068,7 +1446,7 @@ def render_requirement_lens(
             options=set_ids,
             index=0,
         )
-        filtered_req_df = req_df[req_df["requirement_set_id"] == selected_set_id].copy()
+        filtered_req_df = req_df[req_df["requirement_set_id"] == selected_set_id]
 
         if filtered_req_df.empty:
             st.info(
@@ -1080,29 +1458,7 @@ def render_requirement_lens(
     # ----------------------------
     # 2) Select a requirement within that set
     # ----------------------------
-    req_labels: Dict[str, str] = {}
-    for _, row in filtered_req_df.iterrows():
-        rid = row.get("requirement_id")
-        if not isinstance(rid, str):
-            continue
-
-        name = row.get("requirement_name", "") or ""
-        ref = row.get("requirement_ref", "") or ""
-        set_id = row.get("requirement_set_id", "") or ""
-
-        label = rid
-        if name:
-            label += f" — {name}"
-
-        trailing_bits = []
-        if ref:
-            trailing_bits.append(ref)
-        if set_id:
-            trailing_bits.append(set_id)
-        if trailing_bits:
-            label += f" ({', '.join(trailing_bits)})"
-
-        req_labels[rid] = label
+    req_labels = _requirement_labels(filtered_req_df)
 
     req_options = list(req_labels.keys())
     if not req_options:
@@ -1115,7 +1471,7 @@ def render_requirement_lens(
         format_func=lambda x: req_labels.get(x, x),
     )
 
-    sel_row = filtered_req_df[filtered_req_df["requirement_id"] == selected_req_id].iloc[0]
+    sel_row = _first_match_row(filtered_req_df, "requirement_id", selected_req_id)
 
     # ----------------------------
     # 3) Requirement metadata
@@ -1171,11 +1527,12 @@ def render_requirement_lens(
         st.warning("CRT-C catalogue not loaded or missing 'control_id' column.")
         return
 
-    controls_view, failures_view, comps_view = build_controls_failure_comp_views(
-        bundle_control_ids,
-        c_df,
-        f_df,
-        n_df,
+    # Recently viewed bundles (same control set, unchanged catalogues) reuse their views
+    controls_view, failures_view, comps_view = _session_memo(
+        "_req_lens_views",
+        (frozenset(bundle_control_ids), _catalogue_version("CRT-C", "CRT-F", "CRT-N")),
+        lambda: build_controls_failure_comp_views(bundle_control_ids, c_df, f_df, n_df),
+        max_entries=_BUNDLE_VIEWS_MEMO,
     )
 
     if controls_view.empty:
@@ -1185,18 +1542,7 @@ def render_requirement_lens(
         )
         return
 
-    display_cols = []
-    for col in [
-        "control_id",
-        "control_name",
-        "group_domain",
-        "sub_domain",
-        "type",
-        "function",
-        "risk_level",
-    ]:
-        if col in controls_view.columns:
-            display_cols.append(col)
+    display_cols = _present_cols(controls_view, _CTRL_DISPLAY_COLS)
 
     st.dataframe(
         controls_view[display_cols] if display_cols else controls_view,
@@ -1208,11 +1554,7 @@ def render_requirement_lens(
     # ----------------------------
     st.markdown("#### Focus on a Single Control in the Bundle")
 
-    control_labels = {
-        row["control_id"]: f"{row['control_id']} — {row.get('control_name', '')}"
-        for _, row in controls_view.iterrows()
-        if isinstance(row.get("control_id"), str)
-    }
+    control_labels = _id_labels(controls_view, "control_id", "control_name")
     control_ids = list(control_labels.keys())
 
     selected_control_id = st.selectbox(
@@ -1221,7 +1563,7 @@ def render_requirement_lens(
         format_func=lambda cid: control_labels.get(cid, cid),
     )
 
-    control_row = controls_view[controls_view["control_id"] == selected_control_id].iloc[0]
+    control_row = _first_match_row(controls_view, "control_id", selected_control_id)
 
     st.markdown("##### Control Detail (CRT-C)")
     with st.expander("View control metadata", expanded=True):
@@ -1261,53 +1603,37 @@ def render_requirement_lens(
     # ----------------------------
     st.markdown("##### CRT-F — Failure Modes for this Control")
 
-    control_failure_ids: List[str] = []
-    for col in control_row.index:
-        if col.lower().startswith("mapped_fail"):
-            control_failure_ids.extend(parse_id_list(str(control_row.get(col, ""))))
-    control_failure_ids = sorted(set(control_failure_ids))
+    control_failure_ids, control_comp_ids = _row_mapped_ids(control_row)
 
     if not control_failure_ids or failures_view.empty:
         st.info("No failure modes mapped for this control.")
     else:
-        cf = failures_view[failures_view["failure_id"].isin(control_failure_ids)].copy()
+        cf = failures_view[failures_view["failure_id"].isin(control_failure_ids)]
         if cf.empty:
             st.info("No failure modes found in CRT-F for this control's mappings.")
         else:
-            show_cols = [
-                col
-                for col in ["failure_id", "failure_name", "failure_category",
-                "failure_description"]
-                if col in cf.columns
-            ]
+            show_cols = _present_cols(cf, _FAIL_DISPLAY_COLS)
             st.dataframe(cf[show_cols] if show_cols else cf, width="stretch")
 
     st.markdown("##### CRT-N — Compensating Controls for this Control")
 
-    control_comp_ids: List[str] = []
-    for col in control_row.index:
-        if col.lower().startswith("mapped_comp"):
-            control_comp_ids.extend(parse_id_list(str(control_row.get(col, ""))))
-    control_comp_ids = sorted(set(control_comp_ids))
-
     if not control_comp_ids or comps_view.empty:
         st.info("No compensating controls mapped for this control.")
     else:
         if "n_id" in comps_view.columns:
-            cn = comps_view[comps_view["n_id"].isin(control_comp_ids)].copy()
+            cn = comps_view[comps_view["n_id"].isin(control_comp_ids)]
         else:
-            cn = comps_view.copy()
+            cn = comps_view
 
         if cn.empty:
             st.info("No compensating controls found in CRT-N for this control's mappings.")
         else:
-            show_cols = [
-                col
-                for col in ["n_id", "compensating_name", "strength", "csf_category"]
-                if col in cn.columns
-            ]
+            show_cols = _present_cols(cn, _COMP_DISPLAY_COLS)
             st.dataframe(cn[show_cols] if show_cols else cn, width="stretch")
 
+    # CRT-LR exploded and grouped by control once; shared by the per-control and bundle views below
+    lr_exploded, lr_positions = _catalogue_by_control(lr_df, "CRT-LR")
+
     # ----------------------------
     # 7) Obligations – per-control view (CRT-LR)
     # ----------------------------
@@ -1316,26 +1642,14 @@ def render_requirement_lens(
     if lr_df.empty or "mapped_control_ids" not in lr_df.columns:
         st.info("CRT-LR catalogue not loaded or missing 'mapped_control_ids' for obligations.")
     else:
-        lr_exploded = explode_mapped_ids(lr_df, "mapped_control_ids", "_control_id")
-
         if lr_exploded.empty or "_control_id" not in lr_exploded.columns:
             st.info("No obligations are currently mapped to any controls in CRT-LR.")
         else:
-            lr_for_control = lr_exploded[lr_exploded["_control_id"] == selected_control_id].copy()
+            lr_for_control = _rows_for_controls(lr_exploded, lr_positions, [selected_control_id])
             if lr_for_control.empty:
                 st.info(f"No CRT-LR obligations mapped to control {selected_control_id}.")
             else:
-                lr_display_cols = []
-                for col in [
-                    "lr_id",
-                    "obligation_name",
-                    "obligation_description",
-                    "severity",
-                    "evidence_required",
-                    "source_reference_examples",
-                ]:
-                    if col in lr_for_control.columns:
-                        lr_display_cols.append(col)
+                lr_display_cols = _present_cols(lr_for_control, _LR_DISPLAY_COLS)
 
                 st.dataframe(lr_for_control[lr_display_cols], width="stretch")
 
@@ -1347,31 +1661,17 @@ def render_requirement_lens(
     if lr_df.empty or "mapped_control_ids" not in lr_df.columns:
         st.info("CRT-LR catalogue not loaded or missing 'mapped_control_ids'.")
     else:
-        lr_exploded = explode_mapped_ids(lr_df, "mapped_control_ids", "_control_id")
-
         if lr_exploded.empty or "_control_id" not in lr_exploded.columns:
             st.info("No obligations are mapped to any CRT controls yet.")
         else:
-            lr_for_req = lr_exploded[lr_exploded["_control_id"].isin(bundle_control_ids)].copy()
-            if lr_for_req.empty:
-                st.info("No CRT-LR obligations mapped via this requirement's CRT controls.")
-            else:
-                if "lr_id" in lr_for_req.columns:
-                    lr_for_req = lr_for_req.drop_duplicates(subset=["lr_id"])
-
-                lr_req_cols = []
-                for col in [
-                    "lr_id",
-                    "obligation_name",
-                    "obligation_description",
-                    "severity",
-                    "evidence_required",
-                    "source_reference_examples",
-                ]:
-                    if col in lr_for_req.columns:
-                        lr_req_cols.append(col)
-
-                st.dataframe(lr_for_req[lr_req_cols], width="stretch")
+            _render_linked_rows(
+                lr_exploded,
+                lr_positions,
+                bundle_control_ids,
+                "lr_id",
+                _LR_DISPLAY_COLS,
+                "No CRT-LR obligations mapped via this requirement's CRT controls.",
+            )
 
     # ----------------------------
     # 9) Failure Modes & Compensations – requirement bundle summaries
@@ -1380,11 +1680,7 @@ def render_requirement_lens(
     if failures_view.empty:
         st.info("No failure modes mapped via the CRT controls for this requirement.")
     else:
-        show_cols = [
-            col
-            for col in ["failure_id", "failure_name", "failure_category", "failure_description"]
-            if col in failures_view.columns
-        ]
+        show_cols = _present_cols(failures_view, _FAIL_DISPLAY_COLS)
         st.dataframe(
             failures_view[show_cols].drop_duplicates() if show_cols
             else failures_view.drop_duplicates(),
@@ -1395,11 +1691,7 @@ def render_requirement_lens(
     if comps_view.empty:
         st.info("No compensating controls mapped via the CRT controls for this requirement.")
     else:
-        show_cols = [
-            col
-            for col in ["n_id", "compensating_name", "strength", "csf_category"]
-            if col in comps_view.columns
-        ]
+        show_cols = _present_cols(comps_view, _COMP_DISPLAY_COLS)
         st.dataframe(
             comps_view[show_cols].drop_duplicates() if show_cols else comps_view.drop_duplicates(),
             width="stretch",
@@ -1444,11 +1736,7 @@ def render_policy_lens(
         st.error("CRT-POL catalogue is missing the 'policy_id' column.")
         return
 
-    pol_labels = {
-        row["policy_id"]: f"{row['policy_id']} — {row.get('policy_name', '')}"
-        for _, row in pol_df.iterrows()
-        if isinstance(row.get("policy_id"), str)
-    }
+    pol_labels = _id_labels(pol_df, "policy_id", "policy_name")
 
     policy_ids = list(pol_labels.keys())
     if not policy_ids:
@@ -1461,7 +1749,7 @@ def render_policy_lens(
         format_func=lambda pid: pol_labels.get(pid, pid),
     )
 
-    pol_row = pol_df[pol_df["policy_id"] == selected_pol_id].iloc[0]
+    pol_row = _first_match_row(pol_df, "policy_id", selected_pol_id)
 
     # ----------------------------
     # Policy metadata
@@ -1501,11 +1789,12 @@ def render_policy_lens(
         st.warning("CRT-C catalogue not loaded or missing 'control_id' column.")
         return
 
-    controls_view, failures_view, comps_view = build_controls_failure_comp_views(
-        bundle_control_ids,
-        c_df,
-        f_df,
-        n_df,
+    # Recently viewed bundles (same control set, unchanged catalogues) reuse their views
+    controls_view, failures_view, comps_view = _session_memo(
+        "_pol_lens_views",
+        (frozenset(bundle_control_ids), _catalogue_version("CRT-C", "CRT-F", "CRT-N")),
+        lambda: build_controls_failure_comp_views(bundle_control_ids, c_df, f_df, n_df),
+        max_entries=_BUNDLE_VIEWS_MEMO,
     )
 
     if controls_view.empty:
@@ -1516,18 +1805,7 @@ def render_policy_lens(
         return
 
     # Lightweight projection for the bundle table
-    display_cols = []
-    for col in [
-        "control_id",
-        "control_name",
-        "group_domain",
-        "sub_domain",
-        "type",
-        "function",
-        "risk_level",
-    ]:
-        if col in controls_view.columns:
-            display_cols.append(col)
+    display_cols = _present_cols(controls_view, _CTRL_DISPLAY_COLS)
 
     st.dataframe(controls_view[display_cols], width='stretch')
 
@@ -1536,11 +1814,7 @@ def render_policy_lens(
     # ----------------------------
     st.markdown("#### Focus on a Single Control in the Bundle")
 
-    control_labels = {
-        row["control_id"]: f"{row['control_id']} — {row.get('control_name', '')}"
-        for _, row in controls_view.iterrows()
-        if isinstance(row.get("control_id"), str)
-    }
+    control_labels = _id_labels(controls_view, "control_id", "control_name")
     control_ids = list(control_labels.keys())
 
     selected_control_id = st.selectbox(
@@ -1549,7 +1823,7 @@ def render_policy_lens(
         format_func=lambda cid: control_labels.get(cid, cid),
     )
 
-    control_row = controls_view[controls_view["control_id"] == selected_control_id].iloc[0]
+    control_row = _first_match_row(controls_view, "control_id", selected_control_id)
 
     st.markdown("##### Control Detail (CRT-C)")
     with st.expander("View control metadata", expanded=True):
@@ -1589,53 +1863,38 @@ def render_policy_lens(
     # ----------------------------
     st.markdown("##### CRT-F — Failure Modes for this Control")
 
-    control_failure_ids: List[str] = []
-    for col in control_row.index:
-        if col.lower().startswith("mapped_fail"):
-            control_failure_ids.extend(parse_id_list(str(control_row.get(col, ""))))
-    control_failure_ids = sorted(set(control_failure_ids))
+    control_failure_ids, control_comp_ids = _row_mapped_ids(control_row)
 
     if not control_failure_ids or failures_view.empty:
         st.info("No failure modes mapped for this control.")
     else:
-        cf = failures_view[failures_view["failure_id"].isin(control_failure_ids)].copy()
+        cf = failures_view[failures_view["failure_id"].isin(control_failure_ids)]
         if cf.empty:
             st.info("No failure modes found in CRT-F for this control's mappings.")
         else:
-            show_cols = [
-                col
-                for col in ["failure_id", "failure_name", "failure_category", "failure_description"]
-                if col in cf.columns
-            ]
+            show_cols = _present_cols(cf, _FAIL_DISPLAY_COLS)
             st.dataframe(cf[show_cols] if show_cols else cf, width='stretch')
 
     st.markdown("##### CRT-N — Compensating Controls for this Control")
 
-    control_comp_ids: List[str] = []
-    for col in control_row.index:
-        if col.lower().startswith("mapped_comp"):
-            control_comp_ids.extend(parse_id_list(str(control_row.get(col, ""))))
-    control_comp_ids = sorted(set(control_comp_ids))
-
     if not control_comp_ids or comps_view.empty:
         st.info("No compensating controls mapped for this control.")
     else:
         # `comps_view` has been normalised to `n_id`
         if "n_id" in comps_view.columns:
-            cn = comps_view[comps_view["n_id"].isin(control_comp_ids)].copy()
+            cn = comps_view[comps_view["n_id"].isin(control_comp_ids)]
         else:
-            cn = comps_view.copy()
+            cn = comps_view
 
         if cn.empty:
             st.info("No compensating controls found in CRT-N for this control's mappings.")
         else:
-            show_cols = [
-                col
-                for col in ["n_id", "compensating_name", "strength", "csf_category"]
-                if col in cn.columns
-            ]
+            show_cols = _present_cols(cn, _COMP_DISPLAY_COLS)
             st.dataframe(cn[show_cols] if show_cols else cn, width='stretch')
 
+    # CRT-LR exploded and grouped by control once; shared by the per-control and bundle views below
+    lr_exploded, lr_positions = _catalogue_by_control(lr_df, "CRT-LR")
+
     # ----------------------------
     # 5) Obligations – per-control view (CRT-LR)
     # ----------------------------
@@ -1644,27 +1903,14 @@ def render_policy_lens(
     if lr_df.empty or "mapped_control_ids" not in lr_df.columns:
         st.info("CRT-LR catalogue not loaded or missing 'mapped_control_ids' for obligations.")
     else:
-        # Explode CRT-LR by mapped_control_ids -> _control_id
-        lr_exploded = explode_mapped_ids(lr_df, "mapped_control_ids", "_control_id")
-
         if lr_exploded.empty or "_control_id" not in lr_exploded.columns:
             st.info("No obligations are currently mapped to any controls in CRT-LR.")
         else:
-            lr_for_control = lr_exploded[lr_exploded["_control_id"] == selected_control_id].copy()
+            lr_for_control = _rows_for_controls(lr_exploded, lr_positions, [selected_control_id])
             if lr_for_control.empty:
                 st.info(f"No CRT-LR obligations mapped to control {selected_control_id}.")
             else:
-                lr_display_cols = []
-                for col in [
-                    "lr_id",
-                    "obligation_name",
-                    "obligation_description",
-                    "severity",
-                    "evidence_required",
-                    "source_reference_examples",
-                ]:
-                    if col in lr_for_control.columns:
-                        lr_display_cols.append(col)
+                lr_display_cols = _present_cols(lr_for_control, _LR_DISPLAY_COLS)
 
                 st.dataframe(lr_for_control[lr_display_cols], width="stretch")
 
@@ -1678,11 +1924,7 @@ def render_policy_lens(
     if failures_view.empty:
         st.info("No failure modes mapped via the CRT controls for this policy.")
     else:
-        show_cols = [
-            col
-            for col in ["failure_id", "failure_name", "failure_category", "failure_description"]
-            if col in failures_view.columns
-        ]
+        show_cols = _present_cols(failures_view, _FAIL_DISPLAY_COLS)
         st.dataframe(
             failures_view[show_cols].drop_duplicates() if show_cols
             else failures_view.drop_duplicates(),
@@ -1693,11 +1935,7 @@ def render_policy_lens(
     if comps_view.empty:
         st.info("No compensating controls mapped via the CRT controls for this policy.")
     else:
-        show_cols = [
-            col
-            for col in ["n_id", "compensating_name", "strength", "csf_category"]
-            if col in comps_view.columns
-        ]
+        show_cols = _present_cols(comps_view, _COMP_DISPLAY_COLS)
         st.dataframe(
             comps_view[show_cols].drop_duplicates() if show_cols else comps_view.drop_duplicates(),
             width='stretch',
@@ -1711,32 +1949,17 @@ def render_policy_lens(
     if lr_df.empty or "mapped_control_ids" not in lr_df.columns:
         st.info("CRT-LR catalogue not loaded or missing 'mapped_control_ids'.")
     else:
-        lr_exploded = explode_mapped_ids(lr_df, "mapped_control_ids", "_control_id")
-
         if lr_exploded.empty or "_control_id" not in lr_exploded.columns:
             st.info("No obligations are mapped to any CRT controls yet.")
         else:
-            lr_for_policy = lr_exploded[lr_exploded["_control_id"].isin(bundle_control_ids)].copy()
-            if lr_for_policy.empty:
-                st.info("No CRT-LR obligations mapped via this policy's CRT controls.")
-            else:
-                # Deduplicate so each LR obligation appears once per policy
-                if "lr_id" in lr_for_policy.columns:
-                    lr_for_policy = lr_for_policy.drop_duplicates(subset=["lr_id"])
-
-                lr_policy_cols = []
-                for col in [
-                    "lr_id",
-                    "obligation_name",
-                    "obligation_description",
-                    "severity",
-                    "evidence_required",
-                    "source_reference_examples",
-                ]:
-                    if col in lr_for_policy.columns:
-                        lr_policy_cols.append(col)
-
-                st.dataframe(lr_for_policy[lr_policy_cols], width="stretch")
+            _render_linked_rows(
+                lr_exploded,
+                lr_positions,
+                bundle_control_ids,
+                "lr_id",
+                _LR_DISPLAY_COLS,
+                "No CRT-LR obligations mapped via this policy's CRT controls.",
+            )
 
 # -------------------------------------------------------------------------------------------------
 # Standards Mappings
@@ -1780,11 +2003,7 @@ def render_standard_lens(
     # ----------------------------
     # 1) Select a standard
     # ----------------------------
-    std_labels = {
-        row["standard_id"]: f"{row['standard_id']} — {row.get('standard_name', '')}"
-        for _, row in std_df.iterrows()
-        if isinstance(row.get("standard_id"), str)
-    }
+    std_labels = _id_labels(std_df, "standard_id", "standard_name")
 
     std_options = list(std_labels.keys())
     if not std_options:
@@ -1797,7 +2016,7 @@ def render_standard_lens(
         format_func=lambda x: std_labels.get(x, x),
     )
 
-    sel_row = std_df[std_df["standard_id"] == selected_std_id].iloc[0]
+    sel_row = _first_match_row(std_df, "standard_id", selected_std_id)
 
     # ----------------------------
     # 2) Standard metadata
@@ -1834,11 +2053,12 @@ def render_standard_lens(
         st.warning("CRT-C catalogue not loaded or missing 'control_id' column.")
         return
 
-    controls_view, failures_view, comps_view = build_controls_failure_comp_views(
-        bundle_control_ids,
-        c_df,
-        f_df,
-        n_df,
+    # Recently viewed bundles (same control set, unchanged catalogues) reuse their views
+    controls_view, failures_view, comps_view = _session_memo(
+        "_std_lens_views",
+        (frozenset(bundle_control_ids), _catalogue_version("CRT-C", "CRT-F", "CRT-N")),
+        lambda: build_controls_failure_comp_views(bundle_control_ids, c_df, f_df, n_df),
+        max_entries=_BUNDLE_VIEWS_MEMO,
     )
 
     if controls_view.empty:
@@ -1847,18 +2067,7 @@ def render_standard_lens(
             "Check for ID mismatches between CRT-STD.mapped_control_ids and CRT-C.control_id."
         )
     else:
-        display_cols = []
-        for col in [
-            "control_id",
-            "control_name",
-            "group_domain",
-            "sub_domain",
-            "type",
-            "function",
-            "risk_level",
-        ]:
-            if col in controls_view.columns:
-                display_cols.append(col)
+        display_cols = _present_cols(controls_view, _CTRL_DISPLAY_COLS)
 
         st.dataframe(controls_view[display_cols] if display_cols
         else controls_view, width="stretch")
@@ -1872,11 +2081,7 @@ def render_standard_lens(
     # ----------------------------
     st.markdown("#### Focus on a Single Control in the Bundle")
 
-    control_labels = {
-        row["control_id"]: f"{row['control_id']} — {row.get('control_name', '')}"
-        for _, row in controls_view.iterrows()
-        if isinstance(row.get("control_id"), str)
-    }
+    control_labels = _id_labels(controls_view, "control_id", "control_name")
     control_ids = list(control_labels.keys())
 
     selected_control_id = st.selectbox(
@@ -1885,7 +2090,7 @@ def render_standard_lens(
         format_func=lambda cid: control_labels.get(cid, cid),
     )
 
-    control_row = controls_view[controls_view["control_id"] == selected_control_id].iloc[0]
+    control_row = _first_match_row(controls_view, "control_id", selected_control_id)
 
     st.markdown("##### Control Detail (CRT-C)")
     with st.expander("View control metadata", expanded=True):
@@ -1925,54 +2130,38 @@ def render_standard_lens(
     # ----------------------------
     st.markdown("##### CRT-F — Failure Modes for this Control")
 
-    control_failure_ids: List[str] = []
-    for col in control_row.index:
-        if col.lower().startswith("mapped_fail"):
-            control_failure_ids.extend(parse_id_list(str(control_row.get(col, ""))))
-    control_failure_ids = sorted(set(control_failure_ids))
+    control_failure_ids, control_comp_ids = _row_mapped_ids(control_row)
 
     if not control_failure_ids or failures_view.empty:
         st.info("No failure modes mapped for this control.")
     else:
-        cf = failures_view[failures_view["failure_id"].isin(control_failure_ids)].copy()
+        cf = failures_view[failures_view["failure_id"].isin(control_failure_ids)]
         if cf.empty:
             st.info("No failure modes found in CRT-F for this control's mappings.")
         else:
-            show_cols = [
-                col
-                for col in ["failure_id", "failure_name", "failure_category",
-                "failure_description"]
-                if col in cf.columns
-            ]
+            show_cols = _present_cols(cf, _FAIL_DISPLAY_COLS)
             st.dataframe(cf[show_cols] if show_cols else cf, width="stretch")
 
     st.markdown("##### CRT-N — Compensating Controls for this Control")
 
-    control_comp_ids: List[str] = []
-    for col in control_row.index:
-        if col.lower().startswith("mapped_comp"):
-            control_comp_ids.extend(parse_id_list(str(control_row.get(col, ""))))
-    control_comp_ids = sorted(set(control_comp_ids))
-
     if not control_comp_ids or comps_view.empty:
         st.info("No compensating controls mapped for this control.")
     else:
         # `comps_view` has been normalised to `n_id`
         if "n_id" in comps_view.columns:
-            cn = comps_view[comps_view["n_id"].isin(control_comp_ids)].copy()
+            cn = comps_view[comps_view["n_id"].isin(control_comp_ids)]
         else:
-            cn = comps_view.copy()
+            cn = comps_view
 
         if cn.empty:
             st.info("No compensating controls found in CRT-N for this control's mappings.")
         else:
-            show_cols = [
-                col
-                for col in ["n_id", "compensating_name", "strength", "csf_category"]
-                if col in cn.columns
-            ]
+            show_cols = _present_cols(cn, _COMP_DISPLAY_COLS)
             st.dataframe(cn[show_cols] if show_cols else cn, width="stretch")
 
+    # CRT-LR exploded and grouped by control once; shared by the per-control and bundle views below
+    lr_exploded, lr_positions = _catalogue_by_control(lr_df, "CRT-LR")
+
     # ----------------------------
     # 6) Obligations – per-control view (CRT-LR)
     # ----------------------------
@@ -1981,26 +2170,14 @@ def render_standard_lens(
     if lr_df.empty or "mapped_control_ids" not in lr_df.columns:
         st.info("CRT-LR catalogue not loaded or missing 'mapped_control_ids' for obligations.")
     else:
-        lr_exploded = explode_mapped_ids(lr_df, "mapped_control_ids", "_control_id")
-
         if lr_exploded.empty or "_control_id" not in lr_exploded.columns:
             st.info("No obligations are currently mapped to any controls in CRT-LR.")
         else:
-            lr_for_control = lr_exploded[lr_exploded["_control_id"] == selected_control_id].copy()
+            lr_for_control = _rows_for_controls(lr_exploded, lr_positions, [selected_control_id])
             if lr_for_control.empty:
                 st.info(f"No CRT-LR obligations mapped to control {selected_control_id}.")
             else:
-                lr_display_cols = []
-                for col in [
-                    "lr_id",
-                    "obligation_name",
-                    "obligation_description",
-                    "severity",
-                    "evidence_required",
-                    "source_reference_examples",
-                ]:
-                    if col in lr_for_control.columns:
-                        lr_display_cols.append(col)
+                lr_display_cols = _present_cols(lr_for_control, _LR_DISPLAY_COLS)
 
                 st.dataframe(lr_for_control[lr_display_cols], width="stretch")
 
@@ -2013,11 +2190,7 @@ def render_standard_lens(
     if failures_view.empty:
         st.info("No failure modes mapped via the CRT controls for this standard.")
     else:
-        show_cols = [
-            col
-            for col in ["failure_id", "failure_name", "failure_category", "failure_description"]
-            if col in failures_view.columns
-        ]
+        show_cols = _present_cols(failures_view, _FAIL_DISPLAY_COLS)
         st.dataframe(
             failures_view[show_cols].drop_duplicates() if show_cols
             else failures_view.drop_duplicates(),
@@ -2028,11 +2201,7 @@ def render_standard_lens(
     if comps_view.empty:
         st.info("No compensating controls mapped via the CRT controls for this standard.")
     else:
-        show_cols = [
-            col
-            for col in ["n_id", "compensating_name", "strength", "csf_category"]
-            if col in comps_view.columns
-        ]
+        show_cols = _present_cols(comps_view, _COMP_DISPLAY_COLS)
         st.dataframe(
             comps_view[show_cols].drop_duplicates() if show_cols else comps_view.drop_duplicates(),
             width="stretch",
@@ -2046,31 +2215,17 @@ def render_standard_lens(
     if lr_df.empty or "mapped_control_ids" not in lr_df.columns:
         st.info("CRT-LR catalogue not loaded or missing 'mapped_control_ids'.")
     else:
-        lr_exploded = explode_mapped_ids(lr_df, "mapped_control_ids", "_control_id")
-
         if lr_exploded.empty or "_control_id" not in lr_exploded.columns:
             st.info("No obligations are mapped to any CRT controls yet.")
         else:
-            lr_for_standard = lr_exploded[lr_exploded["_control_id"].isin(bundle_control_ids)].copy()
-            if lr_for_standard.empty:
-                st.info("No CRT-LR obligations mapped via this standard's CRT controls.")
-            else:
-                if "lr_id" in lr_for_standard.columns:
-                    lr_for_standard = lr_for_standard.drop_duplicates(subset=["lr_id"])
-
-                lr_policy_cols = []
-                for col in [
-                    "lr_id",
-                    "obligation_name",
-                    "obligation_description",
-                    "severity",
-                    "evidence_required",
-                    "source_reference_examples",
-                ]:
-                    if col in lr_for_standard.columns:
-                        lr_policy_cols.append(col)
-
-                st.dataframe(lr_for_standard[lr_policy_cols], width="stretch")
+            _render_linked_rows(
+                lr_exploded,
+                lr_positions,
+                bundle_control_ids,
+                "lr_id",
+                _LR_DISPLAY_COLS,
+                "No CRT-LR obligations mapped via this standard's CRT controls.",
+            )
 
 # -------------------------------------------------------------------------------------------------
 # Obligations Mapping
@@ -2113,11 +2268,7 @@ def render_obligation_lens(
     # ----------------------------
     # 1) Select an obligation
     # ----------------------------
-    lr_labels = {
-        row["lr_id"]: f"{row['lr_id']} — {row.get('obligation_name', '')}"
-        for _, row in lr_df.iterrows()
-        if isinstance(row.get("lr_id"), str)
-    }
+    lr_labels = _id_labels(lr_df, "lr_id", "obligation_name")
     lr_options = list(lr_labels.keys())
     if not lr_options:
         st.info("No obligation IDs available in CRT-LR catalogue.")
@@ -2129,7 +2280,7 @@ def render_obligation_lens(
         format_func=lambda x: lr_labels.get(x, x),
     )
 
-    sel_row = lr_df[lr_df["lr_id"] == selected_lr_id].iloc[0]
+    sel_row = _first_match_row(lr_df, "lr_id", selected_lr_id)
 
     # ----------------------------
     # 2) Obligation metadata
@@ -2179,11 +2330,12 @@ def render_obligation_lens(
         st.warning("CRT-C catalogue not loaded or missing 'control_id' column.")
         return
 
-    controls_view, failures_view, comps_view = build_controls_failure_comp_views(
-        mapped_controls,
-        c_df,
-        f_df,
-        n_df,
+    # Recently viewed bundles (same control set, unchanged catalogues) reuse their views
+    controls_view, failures_view, comps_view = _session_memo(
+        "_lr_lens_views",
+        (frozenset(mapped_controls), _catalogue_version("CRT-C", "CRT-F", "CRT-N")),
+        lambda: build_controls_failure_comp_views(mapped_controls, c_df, f_df, n_df),
+        max_entries=_BUNDLE_VIEWS_MEMO,
     )
 
     if controls_view.empty:
@@ -2193,11 +2345,7 @@ def render_obligation_lens(
         )
         return
 
-    bundle_cols = []
-    for col in ["control_id", "control_name", "group_domain", "sub_domain", "type",
-    "function", "risk_level"]:
-        if col in controls_view.columns:
-            bundle_cols.append(col)
+    bundle_cols = _present_cols(controls_view, _CTRL_DISPLAY_COLS)
 
     st.dataframe(
         controls_view[bundle_cols] if bundle_cols else controls_view,
@@ -2211,11 +2359,7 @@ def render_obligation_lens(
     if failures_view.empty:
         st.info("No failure modes mapped via the CRT controls for this obligation.")
     else:
-        show_cols = [
-            col
-            for col in ["failure_id", "failure_name", "failure_category", "failure_description"]
-            if col in failures_view.columns
-        ]
+        show_cols = _present_cols(failures_view, _FAIL_DISPLAY_COLS)
         st.dataframe(
             failures_view[show_cols].drop_duplicates() if show_cols
             else failures_view.drop_duplicates(),
@@ -2226,11 +2370,7 @@ def render_obligation_lens(
     if comps_view.empty:
         st.info("No compensating controls mapped via the CRT controls for this obligation.")
     else:
-        show_cols = [
-            col
-            for col in ["n_id", "compensating_name", "strength", "csf_category"]
-            if col in comps_view.columns
-        ]
+        show_cols = _present_cols(comps_view, _COMP_DISPLAY_COLS)
         st.dataframe(
             comps_view[show_cols].drop_duplicates() if show_cols else comps_view.drop_duplicates(),
             width="stretch",
@@ -2244,30 +2384,19 @@ def render_obligation_lens(
     if pol_df.empty or "mapped_control_ids" not in pol_df.columns:
         st.info("CRT-POL catalogue not loaded or missing 'mapped_control_ids'.")
     else:
-        pol_exploded = explode_mapped_ids(pol_df, "mapped_control_ids", "_control_id")
+        pol_exploded, pol_positions = _catalogue_by_control(pol_df, "CRT-POL")
 
         if pol_exploded.empty or "_control_id" not in pol_exploded.columns:
             st.info("No policies currently mapped to any CRT controls.")
         else:
-            pol_linked = pol_exploded[pol_exploded["_control_id"].isin(mapped_controls)].copy()
-            if pol_linked.empty:
-                st.info("No policies are structurally linked to this obligation via CRT controls.")
-            else:
-                # Deduplicate so each policy appears once
-                if "policy_id" in pol_linked.columns:
-                    pol_linked = pol_linked.drop_duplicates(subset=["policy_id"])
-                else:
-                    pol_linked = pol_linked.drop_duplicates()
-
-                pol_cols = []
-                for col in ["policy_id", "policy_name", "description"]:
-                    if col in pol_linked.columns:
-                        pol_cols.append(col)
-
-                st.dataframe(
-                    pol_linked[pol_cols] if pol_cols else pol_linked,
-                    width="stretch",
-                )
+            _render_linked_rows(
+                pol_exploded,
+                pol_positions,
+                mapped_controls,
+                "policy_id",
+                _POL_DISPLAY_COLS,
+                "No policies are structurally linked to this obligation via CRT controls.",
+            )
 
     # ----------------------------
     # 6) Standards linked via shared CRT controls (CRT-STD)
@@ -2277,29 +2406,19 @@ def render_obligation_lens(
     if std_df.empty or "mapped_control_ids" not in std_df.columns:
         st.info("CRT-STD catalogue not loaded or missing 'mapped_control_ids'.")
     else:
-        std_exploded = explode_mapped_ids(std_df, "mapped_control_ids", "_control_id")
+        std_exploded, std_positions = _catalogue_by_control(std_df, "CRT-STD")
 
         if std_exploded.empty or "_control_id" not in std_exploded.columns:
             st.info("No standards currently mapped to any CRT controls.")
         else:
-            std_linked = std_exploded[std_exploded["_control_id"].isin(mapped_controls)].copy()
-            if std_linked.empty:
-                st.info("No standards are structurally linked to this obligation via CRT controls.")
-            else:
-                if "standard_id" in std_linked.columns:
-                    std_linked = std_linked.drop_duplicates(subset=["standard_id"])
-                else:
-                    std_linked = std_linked.drop_duplicates()
-
-                std_cols = []
-                for col in ["standard_id", "standard_name", "description"]:
-                    if col in std_linked.columns:
-                        std_cols.append(col)
-
-                st.dataframe(
-                    std_linked[std_cols] if std_cols else std_linked,
-                    width="stretch",
-                )
+            _render_linked_rows(
+                std_exploded,
+                std_positions,
+                mapped_controls,
+                "standard_id",
+                _STD_DISPLAY_COLS,
+                "No standards are structurally linked to this obligation via CRT controls.",
+            )
 
 # -------------------------------------------------------------------------------------------------
 # Streamlit Page Configuration
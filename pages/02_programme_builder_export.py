@@ -84,7 +84,7 @@ except Exception:  # pylint: disable=broad-except
 from core.bundle_builder import bundle_to_pretty_json  # type: ignore  # noqa: F401
 from core.module_pattern import (  # type: ignore
     initialise_module_state,
-    build_bundle_for_module,
+    make_bundle_builder,
 )
 ABOUT_APP_MD = os.path.join(PROJECT_ROOT, "docs", "about_program_builder.md")
 ABOUT_SUPPORT_MD = os.path.join(PROJECT_ROOT, "docs", "about_and_support.md")
@@ -145,6 +145,20 @@ PROGRAMME_MODES: Dict[str, str] = {
     "Incident Simulation": "simulation",
 }
 
+# Guardrails stamped on every programme bundle
+PROGRAMME_GUARDRAILS: Dict[str, bool] = {
+    "no_advice": True,
+    "no_configuration": True,
+    "no_assurance": True,
+    "structural_only": True,
+}
+
+# One specialised bundle builder per programme bundle type (built once at import)
+_BUNDLE_BUILDERS = {
+    bundle_type: make_bundle_builder(MODULE_NAME, bundle_type, PROGRAMME_GUARDRAILS)
+    for bundle_type in PROGRAMME_MODES.values()
+}
+
 # Lens bundles — expected to be set by lens pages (historic / session pattern)
 LENS_SESSION_KEYS: Dict[str, str] = {
     "Data Classification Registry (DCR)": "dcr_last_bundle",
@@ -1959,17 +1973,7 @@ def build_programme_bundle(
     except Exception:
         pass
 
-    bundle = build_bundle_for_module(
-        module_name=MODULE_NAME,
-        bundle_type=bundle_type,
-        state=state,
-        extra_guardrails={
-            "no_advice": True,
-            "no_configuration": True,
-            "no_assurance": True,
-            "structural_only": True,
-        },
-    )
+    bundle = _BUNDLE_BUILDERS[bundle_type](state)
 
     bundle["programme_mode"] = programme_mode_label
     bundle["task_type"] = task_type
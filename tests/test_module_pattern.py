@@ -0,0 +1,24 @@
+import unittest
+
+from core.module_pattern import CRTModuleState, add_entity
+
+
+class AddEntityTests(unittest.TestCase):
+    def test_known_entity_type_is_appended(self):
+        state = CRTModuleState()
+
+        add_entity(state, "controls", {"control_id": "C-1"})
+
+        self.assertEqual(state.entities["controls"], [{"control_id": "C-1"}])
+
+    def test_unknown_entity_type_is_rejected(self):
+        state = CRTModuleState()
+
+        with self.assertRaisesRegex(ValueError, "Unknown entity_type: 'widgets'"):
+            add_entity(state, "widgets", {"id": "W-1"})
+
+        self.assertNotIn("widgets", state.entities)
+
+
+if __name__ == "__main__":
+    unittest.main()
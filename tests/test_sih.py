@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+
+from core.sih import SystemIntegratorHub
+
+
+def _write_csv(base_path: str, name: str, text: str) -> None:
+    with open(os.path.join(base_path, f"{name}.csv"), "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+class BuildRelationshipsTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base_path = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_control_matches_whole_tokens_only(self):
+        # Baseline substring matching linked C-1 to rows that only map C-10
+        _write_csv(self.base_path, "CRT-F", (
+            "failure_id,mapped_control_ids\n"
+            "F-1,C-1; C-2\n"
+            "F-2,C-10\n"
+        ))
+        _write_csv(self.base_path, "CRT-N", (
+            "n_id,mapped_control_ids\n"
+            "N-1,\"C-10,C-1\"\n"
+            "N-2,C-100\n"
+        ))
+        sih = SystemIntegratorHub(self.base_path)
+
+        rels = sih.build_relationships({"control_id": "C-1"})
+
+        self.assertEqual(
+            [(r["rel"], r["to_id"]) for r in rels],
+            [("failure_implication", "F-1"), ("compensated_by", "N-1")],
+        )
+
+    def test_targets_use_catalogue_key_not_first_id_column(self):
+        _write_csv(self.base_path, "CRT-F", (
+            "control_id,failure_id,mapped_control_ids\n"
+            "C-9,F-1,C-1\n"
+        ))
+        sih = SystemIntegratorHub(self.base_path)
+
+        rels = sih.build_relationships({"control_id": "C-1"})
+
+        self.assertEqual([r["to_id"] for r in rels], ["F-1"])
+
+
+class LoadCatalogueTests(unittest.TestCase):
+    def test_default_na_markers_load_as_empty_strings(self):
+        with tempfile.TemporaryDirectory() as base_path:
+            _write_csv(base_path, "CRT-C", (
+                "control_id,control_name,notes\n"
+                "C-1,NA,N/A\n"
+                "C-2,,null\n"
+                "C-3,Name, NA \n"
+            ))
+            sih = SystemIntegratorHub(base_path)
+
+            self.assertEqual(sih.resolve_entity("CRT-C", "C-1"), {"control_id": "C-1", "control_name": "", "notes": ""})
+            self.assertEqual(sih.resolve_entity("CRT-C", "C-2")["notes"], "")
+            self.assertEqual(sih.resolve_entity("CRT-C", "C-3")["notes"], " NA ")
+
+
+if __name__ == "__main__":
+    unittest.main()